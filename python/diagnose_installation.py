@@ -113,10 +113,10 @@ def diagnose_karmalentil():
 
     # Check 6: Startup script
     print("6. Checking if startup script ran...")
-    if hasattr(hou.session, 'lentil_lens_database'):
-        print("   ✓ Lens database initialized (startup script ran)")
+    if hasattr(hou.session, 'get_lens_database'):
+        print("   ✓ Lens database accessor installed (startup script ran)")
     else:
-        print("   ❌ Lens database not found (startup script may not have run)")
+        print("   ❌ Lens database accessor not found (startup script may not have run)")
         issues.append("Startup script (123.py) did not run or failed")
 
     print()
@@ -231,20 +231,17 @@ class LensDatabase:
             return False
 
         try:
-            # Update focal length
-            if camera_node.parm('lentil_focal_length'):
-                focal_length = lens.get('focal_length', 50.0)
-                camera_node.parm('lentil_focal_length').set(focal_length)
-
-            # Update f-stop
-            if camera_node.parm('lentil_fstop'):
-                max_fstop = lens.get('max_fstop', 2.8)
-                camera_node.parm('lentil_fstop').set(max_fstop)
-
-            # Update sensor width
-            if camera_node.parm('lentil_sensor_width'):
-                sensor_width = lens.get('sensor_width', 36.0)
-                camera_node.parm('lentil_sensor_width').set(sensor_width)
+            # Update focal length, f-stop and sensor width. Unchanged values
+            # are skipped: every set() fires the parameter's callback, which
+            # re-applies the lens to the camera and its lens material
+            for parm_name, key, default in (('lentil_focal_length', 'focal_length', 50.0),
+                                            ('lentil_fstop', 'max_fstop', 2.8),
+                                            ('lentil_sensor_width', 'sensor_width', 36.0)):
+                parm = camera_node.parm(parm_name)
+                if parm:
+                    value = lens.get(key, default)
+                    if parm.eval() != value:
+                        parm.set(value)
 
             print(f"KarmaLentil: Applied lens '{lens.get('name', lens_id)}' to {camera_node.path()}")
             return True
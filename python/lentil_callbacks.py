@@ -8,6 +8,34 @@ When parameters change, we update the camera's USD properties to apply the effec
 import hou
 
 
+# Lens coefficient key, lens material parameter prefix and label
+_COEFF_PARMS = (
+    ('exit_pupil_x', 'poly_coeffs_x', 'Polynomial Coefficients X'),
+    ('exit_pupil_y', 'poly_coeffs_y', 'Polynomial Coefficients Y'),
+)
+
+
+def _coefficients_applied(lens_mat_node, coeffs):
+    """
+    Check whether the lens material node already holds these coefficients
+
+    Compares against the node's current parameter values, so edits made by
+    hand, undo, or a reloaded scene are all picked up.
+
+    Returns:
+        bool: True if every coefficient array matches the node's parameters
+    """
+    for key, parm_prefix, _ in _COEFF_PARMS:
+        values = list(coeffs.get(key, ()))
+        if lens_mat_node.parm(f"{parm_prefix}{len(values)}"):
+            return False
+        for i, value in enumerate(values):
+            parm = lens_mat_node.parm(f"{parm_prefix}{i}")
+            if parm is None or parm.eval() != value:
+                return False
+    return True
+
+
 def _detect_karma_renderer(camera_node):
     """
     Detect whether Karma CPU or XPU is being used
@@ -46,6 +74,17 @@ def _detect_karma_renderer(camera_node):
         return 'unknown'
 
 
+def _set_if_changed(parm, value):
+    """
+    Set a parameter only if its value differs
+
+    Avoids invalidating the stage (and re-firing callbacks) when a lens is
+    re-applied with the same settings.
+    """
+    if parm.eval() != value:
+        parm.set(value)
+
+
 def _set_lens_material_parameters(lens_mat_node, camera_node, lens_data, focal_length, fstop, focus_distance, sensor_width):
     """
     Set lens shader parameters on the Karma Lens Material node
@@ -157,31 +196,29 @@ def _set_lens_material_parameters(lens_mat_node, camera_node, lens_data, focal_l
         set_or_create_parm('enable_lentil', 1, 'toggle', 'Enable Lentil')
 
         # === Polynomial Coefficients ===
-        # Prepare coefficient arrays (batched - PTG applied once)
         coeffs = lens_data.get('coefficients', {})
+
+        # Node already holds these coefficients - skip the
+        # parameter-interface rebuild (re-applying the same lens is common)
+        if lens_mat_node.parm('poly_coeffs_x0') and _coefficients_applied(lens_mat_node, coeffs):
+            print("  Set all lens parameters on material node (coefficients unchanged)")
+            return
+
+        # Prepare coefficient arrays (batched - PTG applied once)
         coefficient_values = []
 
         # Exit pupil X and Y coefficients
-        if 'exit_pupil_x' in coeffs:
-            coeffs_x = coeffs['exit_pupil_x']
-            x_values = prepare_array_parm('poly_coeffs_x', coeffs_x, 'Polynomial Coefficients X')
-            coefficient_values.extend(x_values)
-            print(f"    Prepared {len(coeffs_x)} X coefficients")
-
-        if 'exit_pupil_y' in coeffs:
-            coeffs_y = coeffs['exit_pupil_y']
-            y_values = prepare_array_parm('poly_coeffs_y', coeffs_y, 'Polynomial Coefficients Y')
-            coefficient_values.extend(y_values)
-            print(f"    Prepared {len(coeffs_y)} Y coefficients")
+        for key, parm_prefix, label in _COEFF_PARMS:
+            if key in coeffs:
+                coefficient_values.extend(prepare_array_parm(parm_prefix, coeffs[key], label))
+                print(f"    Prepared {len(coeffs[key])} {label[-1]} coefficients")
 
         # Apply all parameter template changes at once (optimization)
         if coefficient_values:
             lens_mat_node.setParmTemplateGroup(ptg)
 
-            # Now set all the coefficient values
-            for parm_name, value in coefficient_values:
-                if lens_mat_node.parm(parm_name):
-                    lens_mat_node.parm(parm_name).set(value)
+            # Now set all the coefficient values in one call
+            lens_mat_node.setParms(dict(coefficient_values))
 
         print(f"  Set all lens parameters on material node")
 
@@ -320,16 +357,17 @@ def assign_lens_material(camera_node, focal_length, fstop, focus_distance, senso
             poly_degree = lens_data.get('polynomial_degree', 5)
 
             # Set lens parameters on the Karma Lens Material node
-            # These will be passed to the VEX shader
-            _set_lens_material_parameters(
-                lens_mat_node,
-                camera_node,
-                lens_data,
-                focal_length,
-                fstop,
-                focus_distance,
-                sensor_width
-            )
+            # These will be passed to the VEX shader (one undo entry for all)
+            with hou.undos.group('Set Lentil Lens Parameters'):
+                _set_lens_material_parameters(
+                    lens_mat_node,
+                    camera_node,
+                    lens_data,
+                    focal_length,
+                    fstop,
+                    focus_distance,
+                    sensor_width
+                )
 
             print(f"  Loaded lens data: {lens_data.get('name', lens_model)}")
             print(f"  Polynomial degree: {poly_degree}")
@@ -398,31 +436,31 @@ def apply_lentil_to_camera(node):
     # Focal length
     # LOP cameras use camelCase: 'focalLength' not 'focallength'!
     if node.parm('focalLength'):
-        node.parm('focalLength').set(focal_length)  # in mm
+        _set_if_changed(node.parm('focalLength'), focal_length)  # in mm
     elif node.parm('focal'):
         focal_cm = focal_length / 10.0  # mm to cm
-        node.parm('focal').set(focal_cm)
+        _set_if_changed(node.parm('focal'), focal_cm)
 
     # F-stop
     # LOP cameras use camelCase: 'fStop' not 'fstop'!
     if node.parm('fStop'):
-        node.parm('fStop').set(fstop)
+        _set_if_changed(node.parm('fStop'), fstop)
     elif node.parm('fstop'):
-        node.parm('fstop').set(fstop)
+        _set_if_changed(node.parm('fstop'), fstop)
 
     # Focus distance
     # LOP cameras use camelCase: 'focusDistance' not 'focusdistance'!
     if node.parm('focusDistance'):
-        node.parm('focusDistance').set(focus_distance_m)
+        _set_if_changed(node.parm('focusDistance'), focus_distance_m)
     elif node.parm('focus'):
-        node.parm('focus').set(focus_distance_m)
+        _set_if_changed(node.parm('focus'), focus_distance_m)
 
     # Enable depth of field
     # LOP cameras may not have this toggle - DOF is always on if fstop < inf
     if node.parm('dof'):
-        node.parm('dof').set(1)
+        _set_if_changed(node.parm('dof'), 1)
     elif node.parm('depthoffield'):
-        node.parm('depthoffield').set(1)
+        _set_if_changed(node.parm('depthoffield'), 1)
 
     # Set aperture (sensor width)
     # NOTE: Don't set this - it changes the field of view!
@@ -11,29 +11,40 @@ parameters to standard Houdini nodes!
 import hou
 
 
-def add_lentil_spare_parameters(node):
+# Lentil Lens folder shared by all cameras, once built with the lens database menu
+_LENTIL_FOLDER = None
+
+
+def _get_lentil_folder():
     """
-    Add lentil parameters as spare parameters to a camera node
+    Lentil Lens folder template, built once and shared by all cameras
 
-    Args:
-        node: The camera node that was just created
+    The lens model menu is read from the lens database on the first call.
+    If the database can't be read, the folder gets a one-lens fallback menu
+    and is not kept, so the next camera tries the database again.
+
+    Returns:
+        hou.FolderParmTemplate with all lentil parameters and callbacks
     """
-    # Get the node's current parameter template group
-    ptg = node.parmTemplateGroup()
+    global _LENTIL_FOLDER
 
-    # Check if lentil parameters already exist
-    if ptg.find('enable_lentil'):
-        return  # Already added
+    if _LENTIL_FOLDER is None:
+        lentil_folder, menu_loaded = _build_lentil_folder()
+        if not menu_loaded:
+            return lentil_folder
+        _LENTIL_FOLDER = lentil_folder
 
-    # IMPORTANT: Preserve existing folder structure
-    # Log existing folders for debugging
-    existing_folders = []
-    for pt in ptg.entries():
-        if isinstance(pt, hou.FolderParmTemplate):
-            existing_folders.append(pt.name())
+    return _LENTIL_FOLDER
 
-    print(f"KarmaLentil: Found existing folders: {existing_folders}")
 
+def _build_lentil_folder():
+    """
+    Build the Lentil Lens folder template
+
+    Returns:
+        Tuple of (hou.FolderParmTemplate, whether the lens model menu came
+        from the lens database)
+    """
     # Create Lentil Lens folder
     lentil_folder = hou.FolderParmTemplate('lentil_folder', 'Lentil Lens', folder_type=hou.folderType.Tabs)
 
@@ -65,11 +76,13 @@ def add_lentil_spare_parameters(node):
         from lens_database import get_lens_database
         db = get_lens_database()
         menu_items, menu_labels = db.generate_menu_items()
+        menu_loaded = True
     except Exception as e:
         print(f"KarmaLentil: Warning - Could not load lens database: {e}")
         # Fallback to default lens
         menu_items = ['double_gauss_50mm']
         menu_labels = ['Double Gauss 50mm f/2.8']
+        menu_loaded = False
 
     # Lens model menu (with callback)
     lens_model_parm = hou.MenuParmTemplate(
@@ -254,9 +267,35 @@ def add_lentil_spare_parameters(node):
         )
     )
 
+    return lentil_folder, menu_loaded
+
+
+def add_lentil_spare_parameters(node):
+    """
+    Add lentil parameters as spare parameters to a camera node
+
+    Args:
+        node: The camera node that was just created
+    """
+    # Get the node's current parameter template group
+    ptg = node.parmTemplateGroup()
+
+    # Check if lentil parameters already exist
+    if ptg.find('enable_lentil'):
+        return  # Already added
+
+    # IMPORTANT: Preserve existing folder structure
+    # Log existing folders for debugging
+    existing_folders = []
+    for pt in ptg.entries():
+        if isinstance(pt, hou.FolderParmTemplate):
+            existing_folders.append(pt.name())
+
+    print(f"KarmaLentil: Found existing folders: {existing_folders}")
+
     # Simply append the lentil folder at the end
     # This is the safest approach - doesn't interfere with any existing folders
-    ptg.append(lentil_folder)
+    ptg.append(_get_lentil_folder())
 
     # Apply the modified parameter template group back to the node
     node.setParmTemplateGroup(ptg)
@@ -29,11 +29,16 @@ Usage:
 __version__ = "0.1.0"
 __author__ = "KarmaLentil Project"
 
-# Core components (to be implemented)
-from .lens_importer import LensImporter
-from .poly_fitter import PolyFitter
-from .vex_generator import VEXGenerator
-from .lens_database_manager import LensDatabaseManager
+import importlib
+
+# Core components, imported on first access so 'import potk' does not pull
+# in NumPy, Numba and friends until a component is actually used
+_LAZY_IMPORTS = {
+    'LensImporter': '.lens_importer',
+    'PolyFitter': '.poly_fitter',
+    'VEXGenerator': '.vex_generator',
+    'LensDatabaseManager': '.lens_database_manager',
+}
 
 __all__ = [
     'LensImporter',
@@ -41,3 +46,15 @@ __all__ = [
     'VEXGenerator',
     'LensDatabaseManager'
 ]
+
+
+def __getattr__(name):
+    if name in _LAZY_IMPORTS:
+        value = getattr(importlib.import_module(_LAZY_IMPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
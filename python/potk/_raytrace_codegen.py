@@ -0,0 +1,178 @@
+"""
+Specialized Ray Kernel Generator
+
+Generates a batch ray kernel with one unrolled block per lens surface and the
+surface constants (radius, aperture, cumulative vertex position) baked in as
+literals. Refractive indices depend on the wavelength, so they are passed in
+at run time; a given lens prescription is fixed for the lifetime of a
+SimpleRaytracer, so the generated kernel is compiled once and serves every
+wavelength.
+
+The generated code follows _raytrace_numba.trace_batch_f64 step for step; rays
+are distributed over threads with prange and compiled with relaxed
+floating-point rules, so results can differ from it in the last few ulps.
+"""
+
+import math
+from functools import lru_cache
+from typing import Callable, Tuple
+
+from ._raytrace_numba import HAS_NUMBA
+
+if HAS_NUMBA:
+    from numba import njit, prange
+else:
+    prange = range
+
+# fastmath without 'nnan'/'ninf': failed rays are reported as NaN, so the
+# compiler must not assume NaN/inf away
+_FASTMATH = {'nsz', 'arcp', 'contract', 'afn', 'reassoc'}
+
+
+def _emit_kernel(radii: Tuple[float, ...], thicks: Tuple[float, ...],
+                 diams: Tuple[float, ...]) -> str:
+    """
+    Emit Python source for a kernel specialized to one lens prescription
+
+    Args:
+        radii: Surface radii of curvature
+        thicks: Distances to the next surface
+        diams: Clear aperture diameters
+
+    Returns:
+        Source defining trace_one() and
+        trace_batch(origins, dirs, idx, out_pos, out_dir), where idx holds the
+        refractive index after each surface
+    """
+    fail = '        return False, px, py, pz, dx, dy, dz'
+    lines = [
+        'def trace_one(px, py, pz, dx, dy, dz, idx):',
+        '    inv_len = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)',
+        '    dx *= inv_len',
+        '    dy *= inv_len',
+        '    dz *= inv_len',
+    ]
+
+    z_vertex = 0.0
+
+    for s, (radius, thickness, diameter) in enumerate(zip(radii, thicks, diams)):
+        current_index = f'idx[{s - 1}]' if s else '1.0'
+        lines += [
+            f'    # Surface {s}: R={radius!r}',
+            f'    eta = {current_index} / idx[{s}]',
+            '    if abs(dz) < 1e-10:',
+            fail,
+            f'    t_to_vertex = ({z_vertex!r} - pz) / dz',
+            '    if t_to_vertex < -1e-6:',
+            fail,
+            '    vx = px + t_to_vertex * dx',
+            '    vy = py + t_to_vertex * dy',
+            '    r_sqr = vx * vx + vy * vy',
+            f'    if r_sqr > {(diameter * 0.5) ** 2!r}:',
+            fail,
+        ]
+
+        if abs(radius) > 1e-6:
+            radius_sqr = radius * radius
+            if radius > 0:
+                sag = f'{radius!r} - math.sqrt({radius_sqr!r} - r_sqr)'
+            else:
+                sag = f'{-abs(radius)!r} + math.sqrt({radius_sqr!r} - r_sqr)'
+            sign = '-' if radius < 0 else ''
+            lines += [
+                f'    if r_sqr >= {radius_sqr!r}:',
+                fail,
+                f'    sag = {sag}',
+                f'    t_to_surface = ({z_vertex!r} + sag - pz) / dz',
+                '    px += t_to_surface * dx',
+                '    py += t_to_surface * dy',
+                '    pz += t_to_surface * dz',
+                '    normal_len = math.sqrt(px * px + py * py + sag * sag)',
+                '    if normal_len > 1e-10:',
+                f'        inv_len = {sign}1.0 / normal_len',
+                '        nx = px * inv_len',
+                '        ny = py * inv_len',
+                '        nz = sag * inv_len',
+                '    else:',
+                '        nx = 0.0',
+                '        ny = 0.0',
+                '        nz = 1.0',
+            ]
+        else:
+            lines += [
+                '    px = vx',
+                '    py = vy',
+                '    pz += t_to_vertex * dz',
+                '    nx = 0.0',
+                '    ny = 0.0',
+                '    nz = 1.0',
+            ]
+
+        lines += [
+            '    cos_i = -(dx * nx + dy * ny + dz * nz)',
+            '    if cos_i < 0:',
+            '        cos_i = -cos_i',
+            '        nx = -nx',
+            '        ny = -ny',
+            '        nz = -nz',
+            '    k = 1.0 - eta * eta * (1.0 - cos_i * cos_i)',
+            '    if k < 0:',
+            fail,
+            '    scale = eta * cos_i - math.sqrt(k)',
+            '    dx = eta * dx + scale * nx',
+            '    dy = eta * dy + scale * ny',
+            '    dz = eta * dz + scale * nz',
+        ]
+
+        z_vertex += thickness
+
+    lines += [
+        '    inv_len = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)',
+        '    dx *= inv_len',
+        '    dy *= inv_len',
+        '    dz *= inv_len',
+        '    return True, px, py, pz, dx, dy, dz',
+        '',
+        '',
+        'def trace_batch(origins, dirs, idx, out_pos, out_dir):',
+        '    for i in prange(origins.shape[0]):',
+        '        ok, px, py, pz, dx, dy, dz = trace_one(',
+        '            origins[i, 0], origins[i, 1], origins[i, 2],',
+        '            dirs[i, 0], dirs[i, 1], dirs[i, 2], idx)',
+        '        if not ok:',
+        '            px = py = pz = dx = dy = dz = math.nan',
+        '        out_pos[i, 0] = px',
+        '        out_pos[i, 1] = py',
+        '        out_pos[i, 2] = pz',
+        '        out_dir[i, 0] = dx',
+        '        out_dir[i, 1] = dy',
+        '        out_dir[i, 2] = dz',
+        '',
+    ]
+
+    return '\n'.join(lines)
+
+
+@lru_cache(maxsize=32)
+def get_specialized_kernel(radii: Tuple[float, ...], thicks: Tuple[float, ...],
+                           diams: Tuple[float, ...]) -> Callable:
+    """
+    Compile (or fetch from cache) the kernel for one lens prescription
+
+    Args:
+        radii: Surface radii of curvature
+        thicks: Distances to the next surface
+        diams: Clear aperture diameters
+
+    Returns:
+        trace_batch(origins, dirs, idx, out_pos, out_dir), Numba-compiled when available
+    """
+    source = _emit_kernel(radii, thicks, diams)
+    namespace = {'math': math, 'prange': prange}
+    exec(compile(source, f'<potk kernel S={len(radii)}>', 'exec'), namespace)
+
+    if HAS_NUMBA:
+        namespace['trace_one'] = njit(fastmath=_FASTMATH)(namespace['trace_one'])
+        return njit(parallel=True, fastmath=_FASTMATH)(namespace['trace_batch'])
+
+    return namespace['trace_batch']
@@ -0,0 +1,99 @@
+"""
+CUDA Ray Kernel
+
+GPU variant of the specialized batch kernel from _raytrace_codegen. The same
+per-lens trace_one() source is compiled as a CUDA device function and run with
+one thread per ray, covering all surfaces in a single launch, so rays stay on
+the device from the sensor to the last surface.
+
+SimpleRaytracer uses it when POTK_BACKEND=cuda is set and Numba finds a
+working CUDA driver.
+"""
+
+import math
+from functools import lru_cache
+from typing import Callable, Tuple
+
+import numpy as np
+
+from ._raytrace_codegen import _emit_kernel
+
+try:
+    from numba import cuda
+    HAS_CUDA = cuda.is_available()
+except ImportError:
+    HAS_CUDA = False
+
+_THREADS_PER_BLOCK = 256
+
+
+@lru_cache(maxsize=32)
+def get_cuda_kernel(radii: Tuple[float, ...], thicks: Tuple[float, ...],
+                    diams: Tuple[float, ...]) -> Callable:
+    """
+    Compile (or fetch from cache) the CUDA kernel for one lens prescription
+
+    Args:
+        radii: Surface radii of curvature
+        thicks: Distances to the next surface
+        diams: Clear aperture diameters
+
+    Returns:
+        CUDA kernel trace_batch(origins, dirs, idx, out_pos, out_dir)
+    """
+    source = _emit_kernel(radii, thicks, diams)
+    namespace = {'math': math, 'prange': range}
+    exec(compile(source, f'<potk cuda kernel S={len(radii)}>', 'exec'), namespace)
+
+    trace_one = cuda.jit(device=True)(namespace['trace_one'])
+
+    @cuda.jit
+    def trace_batch(origins, dirs, idx, out_pos, out_dir):
+        i = cuda.grid(1)
+        if i >= origins.shape[0]:
+            return
+
+        ok, px, py, pz, dx, dy, dz = trace_one(
+            origins[i, 0], origins[i, 1], origins[i, 2],
+            dirs[i, 0], dirs[i, 1], dirs[i, 2], idx)
+        if not ok:
+            px = py = pz = dx = dy = dz = math.nan
+
+        out_pos[i, 0] = px
+        out_pos[i, 1] = py
+        out_pos[i, 2] = pz
+        out_dir[i, 0] = dx
+        out_dir[i, 1] = dy
+        out_dir[i, 2] = dz
+
+    return trace_batch
+
+
+def trace_batch_cuda(kernel: Callable, ray_origins: np.ndarray, ray_directions: np.ndarray,
+                     indices: np.ndarray, dtype) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Run a kernel from get_cuda_kernel over a batch of rays
+
+    Args:
+        kernel: Compiled CUDA kernel
+        ray_origins: Ray origins [N, 3]
+        ray_directions: Ray directions [N, 3]
+        indices: Refractive index after each surface at the traced wavelength
+        dtype: Floating point type of inputs and results
+
+    Returns:
+        Tuple of (exit_positions, exit_directions) [N, 3], NaN for failed rays
+    """
+    num_rays = ray_origins.shape[0]
+
+    origins = cuda.to_device(np.ascontiguousarray(ray_origins, dtype=dtype))
+    dirs = cuda.to_device(np.ascontiguousarray(ray_directions, dtype=dtype))
+    idx = cuda.to_device(np.ascontiguousarray(indices, dtype=np.float64))
+    out_pos = cuda.device_array((num_rays, 3), dtype=dtype)
+    out_dir = cuda.device_array((num_rays, 3), dtype=dtype)
+
+    if num_rays:
+        blocks = (num_rays + _THREADS_PER_BLOCK - 1) // _THREADS_PER_BLOCK
+        kernel[blocks, _THREADS_PER_BLOCK](origins, dirs, idx, out_pos, out_dir)
+
+    return out_pos.copy_to_host(), out_dir.copy_to_host()
@@ -0,0 +1,150 @@
+"""
+Compiled Ray Kernel
+
+Batch version of SimpleRaytracer.trace_ray written against plain arrays so it
+can be compiled ahead-of-time with build_aot.py. The JIT path uses the
+per-lens specialized variant from _raytrace_codegen instead.
+
+Lens elements are passed as parallel arrays (radius, thickness, diameter and
+refractive index at the traced wavelength). Failed rays are written as NaN.
+"""
+
+import math
+
+import numpy as np
+
+try:
+    import numba  # noqa: F401
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+
+def trace_batch_f64(origins, dirs, radii, thicks, diams, idx, out_pos, out_dir):
+    """
+    Trace rays through the lens system, writing results into out_pos/out_dir
+
+    Args:
+        origins: Ray origins [N, 3]
+        dirs: Ray directions [N, 3]
+        radii: Surface radii of curvature [S]
+        thicks: Distances to the next surface [S]
+        diams: Clear aperture diameters [S]
+        idx: Refractive index after each surface [S]
+        out_pos: Output exit positions [N, 3]
+        out_dir: Output exit directions [N, 3]
+    """
+    num_rays = origins.shape[0]
+    num_surfaces = radii.shape[0]
+
+    for i in range(num_rays):
+        px = origins[i, 0]
+        py = origins[i, 1]
+        pz = origins[i, 2]
+        dx = dirs[i, 0]
+        dy = dirs[i, 1]
+        dz = dirs[i, 2]
+        inv_len = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)
+        dx *= inv_len
+        dy *= inv_len
+        dz *= inv_len
+
+        current_index = 1.0
+        z_vertex = 0.0
+        ok = True
+
+        for s in range(num_surfaces):
+            radius = radii[s]
+
+            if abs(dz) < 1e-10:
+                ok = False
+                break
+
+            t_to_vertex = (z_vertex - pz) / dz
+            if t_to_vertex < -1e-6:
+                ok = False
+                break
+
+            vx = px + t_to_vertex * dx
+            vy = py + t_to_vertex * dy
+            half = diams[s] * 0.5
+            r_sqr = vx * vx + vy * vy
+            if r_sqr > half * half:
+                ok = False
+                break
+
+            if abs(radius) > 1e-6:
+                radius_sqr = radius * radius
+                if r_sqr >= radius_sqr:
+                    ok = False
+                    break
+
+                if radius > 0:
+                    sag = radius - math.sqrt(radius_sqr - r_sqr)
+                else:
+                    sag = -abs(radius) + math.sqrt(radius_sqr - r_sqr)
+
+                t_to_surface = (z_vertex + sag - pz) / dz
+                px += t_to_surface * dx
+                py += t_to_surface * dy
+                pz += t_to_surface * dz
+
+                normal_len = math.sqrt(px * px + py * py + sag * sag)
+                if normal_len > 1e-10:
+                    inv_len = 1.0 / normal_len
+                    if radius < 0:
+                        inv_len = -inv_len
+                    nx = px * inv_len
+                    ny = py * inv_len
+                    nz = sag * inv_len
+                else:
+                    nx = 0.0
+                    ny = 0.0
+                    nz = 1.0
+            else:
+                px = vx
+                py = vy
+                pz += t_to_vertex * dz
+                nx = 0.0
+                ny = 0.0
+                nz = 1.0
+
+            next_index = idx[s]
+
+            cos_i = -(dx * nx + dy * ny + dz * nz)
+            if cos_i < 0:
+                cos_i = -cos_i
+                nx = -nx
+                ny = -ny
+                nz = -nz
+
+            eta = current_index / next_index
+            k = 1.0 - eta * eta * (1.0 - cos_i * cos_i)
+            if k < 0:
+                ok = False
+                break
+
+            scale = eta * cos_i - math.sqrt(k)
+            dx = eta * dx + scale * nx
+            dy = eta * dy + scale * ny
+            dz = eta * dz + scale * nz
+
+            current_index = next_index
+            z_vertex += thicks[s]
+
+        if ok:
+            # Directions stay unit length through refraction; renormalize once
+            inv_len = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)
+            dx *= inv_len
+            dy *= inv_len
+            dz *= inv_len
+            out_pos[i, 0] = px
+            out_pos[i, 1] = py
+            out_pos[i, 2] = pz
+            out_dir[i, 0] = dx
+            out_dir[i, 1] = dy
+            out_dir[i, 2] = dz
+        else:
+            for c in range(3):
+                out_pos[i, c] = np.nan
+                out_dir[i, c] = np.nan
@@ -0,0 +1,57 @@
+#!/usr/bin/env python3
+"""
+Ahead-of-Time Ray Kernel Build
+
+Compiles the ray kernel from _raytrace_numba.py into a native extension
+(_raytrace_aot) next to this file, so SimpleRaytracer can use it without
+paying Numba's JIT compile time on first call (or without Numba installed).
+
+Usage:
+    python python/potk/build_aot.py
+
+Requires Numba with the numba.pycc module available at build time.
+"""
+
+import sys
+from pathlib import Path
+
+try:
+    from numba.pycc import CC
+except ImportError:
+    CC = None
+
+if __package__:
+    from ._raytrace_numba import trace_batch_f64
+else:
+    from _raytrace_numba import trace_batch_f64
+
+
+def build(output_dir: Path = None):
+    """
+    Compile the _raytrace_aot extension module
+
+    Args:
+        output_dir: Directory for the compiled module (default: this package)
+    """
+    if CC is None:
+        raise RuntimeError("numba.pycc is not available - install Numba to build the AOT kernel")
+
+    cc = CC('_raytrace_aot')
+    cc.output_dir = str(output_dir or Path(__file__).parent)
+    cc.verbose = True
+
+    cc.export(
+        'trace_batch_f64',
+        'void(f8[:,:], f8[:,:], f8[:], f8[:], f8[:], f8[:], f8[:,:], f8[:,:])'
+    )(trace_batch_f64)
+
+    cc.compile()
+    print(f"Built _raytrace_aot in: {cc.output_dir}")
+
+
+if __name__ == '__main__':
+    try:
+        build()
+    except RuntimeError as e:
+        print(f"✗ {e}", file=sys.stderr)
+        sys.exit(1)
@@ -10,10 +10,25 @@ Handles:
 - Metadata management
 """
 
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Tuple
 import json
+import os
+import tempfile
 from datetime import datetime
+import zipfile
+
+# orjson parses float-heavy lens files several times faster; both accept bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+
+# Cached lens summaries for list_lenses, kept in the database root
+CATALOG_FILENAME = 'catalog.json'
 
 
 class LensDatabaseManager:
@@ -69,6 +84,9 @@ class LensDatabaseManager:
         with open(output_path, 'w') as f:
             json.dump(lens_record, f, indent=2)
 
+        self._write_coefficient_cache(self.fitted_dir / f"{lens_id}.npz", lens_record,
+                                      self._source_stamp(output_path))
+
         print(f"Saved lens to database: {lens_id}")
 
         # Save validation report if provided
@@ -94,8 +112,125 @@ class LensDatabaseManager:
             print(f"Lens not found in database: {lens_id}")
             return None
 
-        with open(lens_path, 'r') as f:
-            lens_record = json.load(f)
+        # Binary sidecar: skips parsing the coefficient lists as text. It is
+        # used only if it was written from this exact JSON file (same mtime
+        # and size), like the catalog entries.
+        cache_path = self.fitted_dir / f"{lens_id}.npz"
+        source = self._source_stamp(lens_path)
+        rewrite_cache = True
+
+        try:
+            lens_record = self._read_coefficient_cache(cache_path, source)
+            if lens_record is not None:
+                return lens_record
+        except FileNotFoundError:
+            pass  # No sidecar yet
+        except OSError:
+            # Unreadable (e.g. permissions) - rewriting would fail too
+            rewrite_cache = False
+        except (EOFError, zipfile.BadZipFile, ValueError, KeyError):
+            # Empty, truncated, foreign or old-format sidecar - replace it
+            pass
+
+        lens_record = _json_loads(lens_path.read_bytes())
+
+        if rewrite_cache:
+            self._write_coefficient_cache(cache_path, lens_record, source)
+
+        return lens_record
+
+    def load_many(self, lens_ids: List[str]) -> Dict[str, Dict]:
+        """
+        Load several lenses from database
+
+        Files are read and parsed on a thread pool (file reads and orjson
+        parsing release the GIL for most of their time).
+
+        Args:
+            lens_ids: Lens identifiers
+
+        Returns:
+            Dictionary of lens_id -> lens record, in the order given;
+            lenses that are not found are left out
+        """
+        with ThreadPoolExecutor(max_workers=min(8, len(lens_ids)) or 1) as executor:
+            records = list(executor.map(self.load_lens, lens_ids))
+
+        return {
+            lens_id: record
+            for lens_id, record in zip(lens_ids, records)
+            if record is not None
+        }
+
+    @staticmethod
+    def _source_stamp(lens_path: Path) -> Tuple[int, int]:
+        """
+        Modification time (ns) and size of a lens JSON file
+
+        Args:
+            lens_path: Lens JSON path
+
+        Returns:
+            Tuple of (st_mtime_ns, st_size)
+        """
+        stat = lens_path.stat()
+        return stat.st_mtime_ns, stat.st_size
+
+    @staticmethod
+    def _write_coefficient_cache(cache_path: Path, lens_record: Dict, source: Tuple[int, int]):
+        """
+        Write the .npz sidecar of a lens record
+
+        Coefficients are stored as float64 arrays (lossless); the rest of
+        the record is stored as a JSON string. Records whose coefficients
+        are not plain number lists are not cached.
+
+        Args:
+            cache_path: Sidecar path
+            lens_record: Lens record as stored in the JSON file
+            source: _source_stamp of the JSON file the record was read from
+        """
+        import numpy as np
+
+        try:
+            arrays = {
+                'coeff_' + key: np.asarray(values, dtype=np.float64)
+                for key, values in lens_record.get('coefficients', {}).items()
+            }
+            record = {k: v for k, v in lens_record.items() if k != 'coefficients'}
+            arrays['record'] = np.array(json.dumps(record))
+            arrays['source'] = np.array(source, dtype=np.int64)
+            with open(cache_path, 'wb') as f:
+                np.savez(f, **arrays)
+        except (OSError, TypeError, ValueError, AttributeError):
+            # Read-only database or unusual coefficients - JSON still works
+            pass
+
+    @staticmethod
+    def _read_coefficient_cache(cache_path: Path, source: Tuple[int, int]) -> Optional[Dict]:
+        """
+        Rebuild a lens record from its .npz sidecar
+
+        Args:
+            cache_path: Sidecar path
+            source: _source_stamp of the current JSON file
+
+        Returns:
+            Lens record as in the JSON file, except that coefficients always
+            come back as floats; None if the sidecar was written from a
+            different version of the JSON file
+        """
+        import numpy as np
+
+        with np.load(cache_path) as data:
+            if tuple(data['source'].tolist()) != tuple(source):
+                return None
+
+            lens_record = _json_loads(str(data['record']))
+            lens_record['coefficients'] = {
+                name[len('coeff_'):]: data[name].tolist()
+                for name in data.files if name.startswith('coeff_')
+            }
 
         return lens_record
 
@@ -111,29 +246,123 @@ class LensDatabaseManager:
         """
         lenses = []
 
-        for lens_file in self.fitted_dir.glob('*.json'):
-            with open(lens_file, 'r') as f:
-                lens_data = json.load(f)
+        catalog, _ = self._load_catalog()
 
+        for entry in catalog.values():
             # Apply filters if provided
             if filter_by:
                 match = True
                 for key, value in filter_by.items():
-                    if lens_data.get('metadata', {}).get(key) != value:
+                    if entry['metadata'].get(key) != value:
                         match = False
                         break
                 if not match:
                     continue
 
             lenses.append({
-                'id': lens_data['id'],
-                'name': lens_data.get('name', lens_data['id']),
-                'created': lens_data.get('created', 'unknown'),
-                'metadata': lens_data.get('metadata', {})
+                'id': entry['id'],
+                'name': entry['name'],
+                'created': entry['created'],
+                'metadata': entry['metadata']
             })
 
         return sorted(lenses, key=lambda x: x['name'])
 
+    def _load_catalog(self) -> Tuple[Dict[str, Dict], Dict[str, List[str]]]:
+        """
+        Summary (id, name, created, metadata) of every fitted lens
+
+        Summaries are cached in CATALOG_FILENAME under the database root,
+        keyed by file name and modification time, so only lens files that
+        changed since the last listing are parsed. The file also holds the
+        trigram search index, rebuilt whenever a summary changes.
+
+        Returns:
+            Tuple of (lens file name -> summary, trigram -> lens file names)
+        """
+        catalog_path = self.database_root / CATALOG_FILENAME
+        try:
+            stored = _json_loads(catalog_path.read_bytes())
+            cached = stored['lenses']
+            index = stored['trigrams']
+        except (OSError, ValueError, KeyError, TypeError):
+            cached = {}
+            index = {}
+
+        catalog = {}
+        changed = False
+
+        for lens_file in self.fitted_dir.glob('*.json'):
+            mtime = lens_file.stat().st_mtime_ns
+            entry = cached.get(lens_file.name)
+
+            if entry is None or entry.get('mtime') != mtime:
+                lens_data = _json_loads(lens_file.read_bytes())
+                entry = {
+                    'mtime': mtime,
+                    'id': lens_data['id'],
+                    'name': lens_data.get('name', lens_data['id']),
+                    'created': lens_data.get('created', 'unknown'),
+                    'metadata': lens_data.get('metadata', {})
+                }
+                changed = True
+
+            catalog[lens_file.name] = entry
+
+        if changed or len(catalog) != len(cached):
+            index = self._build_search_index(catalog)
+            # Write next to the catalog and rename over it, so concurrent
+            # readers never see a partly written file
+            tmp_path = None
+            try:
+                fd, tmp_path = tempfile.mkstemp(dir=self.database_root, prefix='.catalog-',
+                                                suffix='.tmp')
+                with os.fdopen(fd, 'w') as f:
+                    json.dump({'lenses': catalog, 'trigrams': index}, f)
+                # mkstemp creates the file owner-only; the catalog is shared
+                os.chmod(tmp_path, 0o644)
+                os.replace(tmp_path, catalog_path)
+            except OSError:
+                # Read-only database - listing still works, just uncached
+                if tmp_path is not None:
+                    try:
+                        os.unlink(tmp_path)
+                    except OSError:
+                        pass
+
+        return catalog, index
+
+    @staticmethod
+    def _search_text(entry: Dict) -> str:
+        """
+        Lowercased text search_lenses matches against
+
+        Args:
+            entry: Lens summary
+
+        Returns:
+            Name and JSON metadata, one per line
+        """
+        return entry['name'].lower() + '\n' + json.dumps(entry['metadata']).lower()
+
+    @classmethod
+    def _build_search_index(cls, catalog: Dict[str, Dict]) -> Dict[str, List[str]]:
+        """
+        Build the inverted trigram index over lens names and metadata
+
+        Args:
+            catalog: Lens file name -> summary
+
+        Returns:
+            Dictionary of trigram -> lens file names containing it
+        """
+        index = {}
+        for file_name, entry in catalog.items():
+            text = cls._search_text(entry)
+            for trigram in {text[k:k + 3] for k in range(len(text) - 2)}:
+                index.setdefault(trigram, []).append(file_name)
+        return index
+
     def search_lenses(self, query: str) -> List[Dict]:
         """
         Search lenses by name or metadata
@@ -144,20 +373,32 @@ class LensDatabaseManager:
         Returns:
             List of matching lens records
         """
-        all_lenses = self.list_lenses()
         query_lower = query.lower()
+        catalog, index = self._load_catalog()
+
+        # Narrow down with the trigram index: a lens can only match if it
+        # contains every trigram of the query. Shorter queries scan all lenses.
+        if len(query_lower) >= 3:
+            postings = [index.get(query_lower[k:k + 3], ()) for k in range(len(query_lower) - 2)]
+            candidates = set(postings[0]).intersection(*postings[1:])
+        else:
+            candidates = catalog.keys()
 
         matches = []
-        for lens in all_lenses:
-            # Search in name
-            if query_lower in lens['name'].lower():
-                matches.append(lens)
-                continue
+        for file_name in candidates:
+            entry = catalog[file_name]
 
-            # Search in metadata
-            metadata_str = json.dumps(lens['metadata']).lower()
-            if query_lower in metadata_str:
-                matches.append(lens)
+            # Search in name, then in metadata
+            if (query_lower in entry['name'].lower() or
+                    query_lower in json.dumps(entry['metadata']).lower()):
+                matches.append({
+                    'id': entry['id'],
+                    'name': entry['name'],
+                    'created': entry['created'],
+                    'metadata': entry['metadata']
+                })
+
+        matches.sort(key=lambda x: x['name'])
 
         return matches
 
@@ -174,28 +415,13 @@ class LensDatabaseManager:
         invalid_count = 0
         errors = []
 
-        for lens_file in self.fitted_dir.glob('*.json'):
-            try:
-                with open(lens_file, 'r') as f:
-                    lens_data = json.load(f)
-
-                # Check required fields
-                required_fields = ['id', 'name', 'coefficients']
-                for field in required_fields:
-                    if field not in lens_data:
-                        raise ValueError(f"Missing required field: {field}")
-
-                # Check coefficients
-                coeffs = lens_data['coefficients']
-                if not isinstance(coeffs, dict):
-                    raise ValueError("Coefficients must be a dictionary")
-
+        for name, error in self.iter_validate():
+            if error is None:
                 valid_count += 1
-                print(f"  ✓ {lens_data['id']}")
-
-            except Exception as e:
+                print(f"  ✓ {name}")
+            else:
                 invalid_count += 1
-                error_msg = f"  ✗ {lens_file.name}: {str(e)}"
+                error_msg = f"  ✗ {name}: {error}"
                 errors.append(error_msg)
                 print(error_msg)
 
@@ -203,6 +429,59 @@ class LensDatabaseManager:
 
         return valid_count, invalid_count, errors
 
+    def iter_validate(self, jobs: int = 1) -> Iterator[Tuple[str, Optional[str]]]:
+        """
+        Validate lenses one at a time
+
+        Args:
+            jobs: Number of worker processes; results are still yielded in
+                  file order
+
+        Yields:
+            (lens_id, None) for a valid lens, (file_name, error) otherwise
+        """
+        lens_files = self.fitted_dir.glob('*.json')
+
+        if jobs <= 1:
+            for lens_file in lens_files:
+                yield self._validate_lens_file(lens_file)
+            return
+
+        lens_files = list(lens_files)
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            yield from executor.map(self._validate_lens_file, lens_files,
+                                    chunksize=max(1, min(16, len(lens_files) // jobs)))
+
+    @staticmethod
+    def _validate_lens_file(lens_file: Path) -> Tuple[str, Optional[str]]:
+        """
+        Validate one lens file
+
+        Args:
+            lens_file: Lens JSON path
+
+        Returns:
+            (lens_id, None) if valid, otherwise (file_name, error message)
+        """
+        try:
+            lens_data = _json_loads(lens_file.read_bytes())
+
+            # Check required fields
+            required_fields = ['id', 'name', 'coefficients']
+            for field in required_fields:
+                if field not in lens_data:
+                    raise ValueError(f"Missing required field: {field}")
+
+            # Check coefficients
+            coeffs = lens_data['coefficients']
+            if not isinstance(coeffs, dict):
+                raise ValueError("Coefficients must be a dictionary")
+
+            return lens_data['id'], None
+
+        except Exception as e:
+            return lens_file.name, str(e)
+
     def export_database(self, output_path: Path):
         """
         Export entire database to single JSON file
@@ -31,13 +31,14 @@ class PolyFitter:
     otherwise falls back to NumPy implementation.
     """
 
-    def __init__(self, degree: int = 7, samples: int = 10000):
+    def __init__(self, degree: int = 7, samples: int = 10000, seed: Optional[int] = None):
         """
         Initialize polynomial fitter
 
         Args:
             degree: Polynomial degree (typically 5-9)
             samples: Number of ray samples for fitting
+            seed: Seed for ray sampling (NumPy implementation only)
         """
         self.degree = degree
         self.samples = samples
@@ -47,7 +48,7 @@ class PolyFitter:
             self._fitter = CppPolyFitter(degree, samples)
             self._implementation = 'cpp'
         else:
-            self._fitter = NumpyPolyFitter(degree, samples)
+            self._fitter = NumpyPolyFitter(degree, samples, seed=seed)
             self._implementation = 'numpy'
 
     def fit(self, optical_system, validation_samples: int = 5000) -> Dict[str, List[float]]:
@@ -0,0 +1,129 @@
+"""
+Polynomial Evaluation
+
+Batched evaluation of the bivariate lens polynomials produced by the fitters.
+
+Coefficients follow the fitter basis: monomials x^i * y^j with i + j <= degree,
+ordered by total degree and then by the power of x, so term (i, j) is stored
+at index (i + j) * (i + j + 1) // 2 + i.
+
+Evaluation uses Estrin's scheme: terms are combined pairwise (c0 + c1*x,
+c2 + c3*x, ...) and the pairs combined again with x^2, x^4, ... so the
+multiply-adds of one level are independent of each other instead of forming
+one serial Horner chain.
+"""
+
+from functools import lru_cache
+from typing import Sequence, Tuple
+
+import numpy as np
+
+
+def estrin(c: Sequence, x):
+    """
+    Evaluate sum(c[k] * x**k) with Estrin's scheme
+
+    Args:
+        c: Coefficients, lowest power first; entries may be arrays that
+           broadcast against x
+        x: Evaluation point(s)
+
+    Returns:
+        Polynomial value(s)
+    """
+    terms = list(c)
+    if not terms:
+        return np.zeros_like(x)
+
+    power = x
+    while len(terms) > 1:
+        paired = [terms[k] + terms[k + 1] * power for k in range(0, len(terms) - 1, 2)]
+        if len(terms) % 2:
+            paired.append(terms[-1])
+        terms = paired
+        power = power * power
+
+    return terms[0]
+
+
+def num_coefficients(degree: int) -> int:
+    """
+    Number of bivariate terms for a polynomial degree
+
+    Args:
+        degree: Polynomial degree
+
+    Returns:
+        (degree + 1) * (degree + 2) // 2
+    """
+    return (degree + 1) * (degree + 2) // 2
+
+
+@lru_cache(maxsize=16)
+def _x_power_indices(degree: int) -> Tuple[Tuple[int, ...], ...]:
+    """
+    Coefficient indices grouped by power of x
+
+    Returns:
+        For each i in 0..degree, the indices of terms x^i * y^j, j ascending
+    """
+    return tuple(
+        tuple((i + j) * (i + j + 1) // 2 + i for j in range(degree - i + 1))
+        for i in range(degree + 1)
+    )
+
+
+def stack_coefficients(coefficient_sets: Sequence[Sequence[float]], degree: int) -> np.ndarray:
+    """
+    Stack coefficient vectors into one zero-padded array
+
+    Shorter vectors (fits of a lower degree) are padded with zeros so all
+    polynomials can be evaluated together.
+
+    Args:
+        coefficient_sets: K coefficient vectors
+        degree: Polynomial degree to evaluate at
+
+    Returns:
+        Coefficient array [K, num_coefficients(degree)]
+    """
+    stacked = np.zeros((len(coefficient_sets), num_coefficients(degree)))
+    for row, coeffs in zip(stacked, coefficient_sets):
+        coeffs = np.asarray(coeffs, dtype=np.float64)[:row.size]
+        row[:coeffs.size] = coeffs
+    return stacked
+
+
+def eval_bivariate(coeffs: np.ndarray, x: np.ndarray, y: np.ndarray, degree: int) -> np.ndarray:
+    """
+    Evaluate one or more bivariate polynomials at many points
+
+    Each polynomial is evaluated as an Estrin polynomial in x whose
+    coefficients are Estrin polynomials in y. All K polynomials share the
+    powers of x and y, so they are evaluated with one set of products.
+
+    Args:
+        coeffs: Coefficients [M] or [K, M] in the fitter basis
+        x: First input [N]
+        y: Second input [N]
+        degree: Polynomial degree
+
+    Returns:
+        Values [N] for 1-D coeffs, otherwise [K, N]
+    """
+    coeffs = np.asarray(coeffs, dtype=np.float64)
+    single = coeffs.ndim == 1
+    if single:
+        coeffs = coeffs[np.newaxis]
+
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+
+    # One polynomial in y per power of x, for all K sets at once: [K, N] each
+    y_polys = [
+        estrin(list(coeffs[:, list(indices), np.newaxis].transpose(1, 0, 2)), y)
+        for indices in _x_power_indices(degree)
+    ]
+    values = estrin(y_polys, x)
+
+    return values[0] if single else values
@@ -10,8 +10,11 @@ where C++ extensions are not available.
 Note: Less accurate and slower than the C++ implementation, but functionally complete.
 """
 
+import functools
+
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
+from .polyeval import eval_bivariate, stack_coefficients
 from .simple_raytracer import SimpleRaytracer
 
 
@@ -22,16 +25,22 @@ class NumpyPolyFitter:
     Uses least-squares polynomial fitting to approximate lens ray behavior.
     """
 
-    def __init__(self, degree: int = 7, samples: int = 10000):
+    # Above this many rays the normal equations are accumulated chunk by
+    # chunk instead of building the whole feature matrix
+    _CHUNK_ROWS = 65536
+
+    def __init__(self, degree: int = 7, samples: int = 10000, seed: Optional[int] = None):
         """
         Initialize polynomial fitter
 
         Args:
             degree: Polynomial degree (typically 5-9)
             samples: Number of ray samples for fitting
+            seed: Seed for aperture sampling (None for a fresh random seed)
         """
         self.degree = degree
         self.samples = samples
+        self._rng = np.random.default_rng(seed)
         self.num_coeffs = (degree + 1) * (degree + 2) // 2
 
     def fit(self, optical_system: dict, wavelength: float = 550.0) -> Dict[str, List[float]]:
@@ -68,17 +77,18 @@ class NumpyPolyFitter:
         )
 
         # Filter valid rays (remove vignetted)
-        valid = ~np.isnan(exit_positions[:, 0])
-        num_valid = np.sum(valid)
+        valid = np.isfinite(exit_positions[:, 0])
+        num_valid = np.count_nonzero(valid)
         print(f"  Valid rays: {num_valid}/{self.samples} ({100.0 * num_valid / self.samples:.1f}%)")
 
         if num_valid < self.num_coeffs * 2:
             print(f"  ⚠️  Warning: Low ray count may affect fit quality")
 
-        sensor_positions = sensor_positions[valid]
-        aperture_positions = aperture_positions[valid]
-        exit_positions = exit_positions[valid]
-        exit_directions = exit_directions[valid]
+        # Pack the per-ray arrays side by side so the mask is applied in one pass
+        packed = np.hstack([sensor_positions, aperture_positions,
+                            exit_positions, exit_directions])[valid]
+        sensor_positions, aperture_positions, exit_positions, exit_directions = \
+            np.hsplit(packed, [2, 4, 7])
 
         # Fit polynomials
         print(f"  Fitting exit pupil polynomials...")
@@ -137,19 +147,16 @@ class NumpyPolyFitter:
             ray_origins, ray_directions, wavelength
         )
 
-        # Evaluate polynomial approximation
+        # Evaluate polynomial approximation (only where the real lens passes the ray)
+        valid = np.isfinite(exit_positions_real[:, 0])
         exit_positions_poly = self._evaluate_polynomial(
-            sensor_positions, aperture_positions, coefficients
+            sensor_positions[valid], aperture_positions[valid], coefficients
         )
 
         # Compute RMS error
-        valid = ~np.isnan(exit_positions_real[:, 0])
-        errors = np.linalg.norm(
-            exit_positions_real[valid] - exit_positions_poly[valid],
-            axis=1
-        )
+        errors = np.linalg.norm(exit_positions_real[valid] - exit_positions_poly, axis=1)
 
-        rms_error = np.sqrt(np.mean(errors ** 2))
+        rms_error = np.sqrt(np.mean(errors ** 2)).item()
 
         print(f"  RMS error: {rms_error:.6f}mm")
         print(f"  Max error: {np.max(errors):.6f}mm")
@@ -184,9 +191,10 @@ class NumpyPolyFitter:
         uu, vv = np.meshgrid(u, v)
         sensor_positions = np.stack([uu.ravel(), vv.ravel()], axis=1)
 
-        # Random aperture sampling (uniform disk)
-        r = np.sqrt(np.random.rand(len(sensor_positions)))
-        theta = 2 * np.pi * np.random.rand(len(sensor_positions))
+        # Random aperture sampling (uniform disk), both variates in one draw
+        u_r, u_theta = self._rng.random((2, len(sensor_positions)))
+        r = np.sqrt(u_r)
+        theta = 2 * np.pi * u_theta
         aperture_positions = np.stack([r * np.cos(theta), r * np.sin(theta)], axis=1)
 
         return sensor_positions[:num_samples], aperture_positions[:num_samples]
@@ -257,14 +265,10 @@ class NumpyPolyFitter:
         # Input features: sensor_x, sensor_y, aperture_x, aperture_y
         X = np.concatenate([sensor_pos, aperture_pos], axis=1)
 
-        # Build polynomial feature matrix
-        features = self._build_polynomial_features(X, self.degree)
+        # Fit X and Y together (one factorization, two right-hand sides)
+        coeffs = self._fit_polynomial(X, exit_pos[:, :2])
 
-        # Fit X and Y separately
-        coeffs_x = np.linalg.lstsq(features, exit_pos[:, 0], rcond=None)[0]
-        coeffs_y = np.linalg.lstsq(features, exit_pos[:, 1], rcond=None)[0]
-
-        return coeffs_x, coeffs_y
+        return coeffs[:, 0], coeffs[:, 1]
 
     def _fit_entrance_pupil(self, sensor_pos: np.ndarray, aperture_pos: np.ndarray,
                            exit_pos: np.ndarray, exit_dir: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
@@ -284,12 +288,85 @@ class NumpyPolyFitter:
         # This is a simplified approach - real implementation would trace backwards
 
         X = np.concatenate([exit_pos[:, :2], exit_dir[:, :2]], axis=1)
-        features = self._build_polynomial_features(X, self.degree)
+        coeffs = self._fit_polynomial(X, sensor_pos[:, :2])
+
+        return coeffs[:, 0], coeffs[:, 1]
+
+    def _fit_polynomial(self, X: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Fit polynomial coefficients mapping inputs to targets
+
+        Up to _CHUNK_ROWS rays the full feature matrix is built and solved
+        directly; beyond that the normal equations are accumulated in chunks
+        so memory stays O(num_coeffs^2) instead of O(N * num_coeffs).
+
+        Args:
+            X: Input features [N, 4]
+            targets: Target values [N, K]
+
+        Returns:
+            Coefficients [num_coeffs, K]
+        """
+        if len(X) <= self._CHUNK_ROWS:
+            features = self._build_polynomial_features(X, self.degree)
+            return self._solve_least_squares(features, targets)
+
+        return self._solve_normal_equations(X, targets)
+
+    def _solve_normal_equations(self, X: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Least-squares solve via chunk-accumulated normal equations
+
+        Args:
+            X: Input features [N, 4]
+            targets: Target values [N, K]
+
+        Returns:
+            Coefficients [num_coeffs, K]
+        """
+        gram = np.zeros((self.num_coeffs, self.num_coeffs))
+        rhs = np.zeros((self.num_coeffs, targets.shape[1]))
+
+        for start in range(0, len(X), self._CHUNK_ROWS):
+            stop = start + self._CHUNK_ROWS
+            chunk = self._build_polynomial_features(X[start:stop], self.degree)
+            gram += chunk.T @ chunk
+            rhs += chunk.T @ targets[start:stop]
+
+        # Same unit column scaling as _solve_least_squares, applied to the
+        # Gram matrix; a tiny ridge keeps it positive definite when columns
+        # are (nearly) dependent
+        scale = np.sqrt(np.diag(gram))
+        scale[scale == 0] = 1.0
+        gram /= np.outer(scale, scale)
+        gram[np.diag_indices_from(gram)] += 1e-10
+
+        coeffs = np.linalg.solve(gram, rhs / scale[:, np.newaxis])
 
-        coeffs_x = np.linalg.lstsq(features, sensor_pos[:, 0], rcond=None)[0]
-        coeffs_y = np.linalg.lstsq(features, sensor_pos[:, 1], rcond=None)[0]
+        return coeffs / scale[:, np.newaxis]
 
-        return coeffs_x, coeffs_y
+    @staticmethod
+    def _solve_least_squares(features: np.ndarray, targets: np.ndarray) -> np.ndarray:
+        """
+        Least-squares solve for all target columns at once
+
+        Monomial columns span many orders of magnitude (e.g. x^7 of exit
+        positions in mm), so each column is scaled to unit norm before the
+        SVD-based solve and the coefficients are scaled back afterwards.
+
+        Args:
+            features: Feature matrix [N, num_coeffs]
+            targets: Target values [N, K]
+
+        Returns:
+            Coefficients [num_coeffs, K]
+        """
+        scale = np.linalg.norm(features, axis=0)
+        scale[scale == 0] = 1.0
+
+        coeffs = np.linalg.lstsq(features / scale, targets, rcond=None)[0]
+
+        return coeffs / scale[:, np.newaxis]
 
     def _build_polynomial_features(self, X: np.ndarray, degree: int) -> np.ndarray:
         """
@@ -302,21 +379,45 @@ class NumpyPolyFitter:
         Returns:
             Feature matrix [N, num_coeffs]
         """
-        num_samples = X.shape[0]
-        features = []
-
         # For simplicity, use only sensor positions for polynomial
         # (full implementation would use all 4 dimensions)
         x = X[:, 0]
         y = X[:, 1]
 
-        # Generate polynomial terms: x^i * y^j where i+j <= degree
-        for total_deg in range(degree + 1):
-            for i in range(total_deg + 1):
-                j = total_deg - i
-                features.append(x**i * y**j)
+        # Power tables x^0..x^degree and y^0..y^degree by repeated
+        # multiplication, then each term x^i * y^j is one product
+        x_powers = np.empty((degree + 1, len(x)))
+        y_powers = np.empty((degree + 1, len(y)))
+        x_powers[0] = 1.0
+        y_powers[0] = 1.0
+        for k in range(1, degree + 1):
+            np.multiply(x_powers[k - 1], x, out=x_powers[k])
+            np.multiply(y_powers[k - 1], y, out=y_powers[k])
+
+        # Terms ordered by total degree i+j <= degree, then by the power of x
+        i_idx, j_idx = self._term_powers(degree)
+
+        return (x_powers[i_idx] * y_powers[j_idx]).T
 
-        return np.stack(features, axis=1)
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _term_powers(degree: int) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Powers of x and y for each polynomial term, in coefficient order
+
+        Cached per degree; the returned arrays are read-only.
+
+        Args:
+            degree: Maximum polynomial degree
+
+        Returns:
+            Tuple of (x_powers, y_powers) index arrays [num_coeffs]
+        """
+        pairs = [(i, total_deg - i) for total_deg in range(degree + 1) for i in range(total_deg + 1)]
+        i_idx, j_idx = np.array(pairs, dtype=np.intp).T.copy()
+        i_idx.setflags(write=False)
+        j_idx.setflags(write=False)
+        return i_idx, j_idx
 
     def _evaluate_polynomial(self, sensor_pos: np.ndarray, aperture_pos: np.ndarray,
                             coefficients: Dict[str, List[float]]) -> np.ndarray:
@@ -331,14 +432,12 @@ class NumpyPolyFitter:
         Returns:
             Evaluated positions [N, 3]
         """
-        X = np.concatenate([sensor_pos, aperture_pos], axis=1)
-        features = self._build_polynomial_features(X, self.degree)
-
-        coeffs_x = np.array(coefficients['exit_pupil_x'])
-        coeffs_y = np.array(coefficients['exit_pupil_y'])
-
-        exit_x = features @ coeffs_x
-        exit_y = features @ coeffs_y
+        # Both directions evaluated together, straight from the coefficients
+        # (no [N, num_coeffs] feature matrix)
+        coeffs = stack_coefficients(
+            [coefficients['exit_pupil_x'], coefficients['exit_pupil_y']], self.degree
+        )
+        exit_x, exit_y = eval_bivariate(coeffs, sensor_pos[:, 0], sensor_pos[:, 1], self.degree)
         exit_z = np.zeros_like(exit_x)  # Simplified
 
         return np.stack([exit_x, exit_y, exit_z], axis=1)
@@ -10,15 +10,53 @@ Note: This is less accurate than the full polynomial-optics C++ implementation,
       but sufficient for demonstration and workflow testing.
 """
 
+import functools
+import math
+import os
+from concurrent.futures import ThreadPoolExecutor
+
 import numpy as np
 from typing import List, Tuple, Optional
 
+from ._raytrace_codegen import get_specialized_kernel
+from ._raytrace_numba import HAS_NUMBA
+
+# Prefer the ahead-of-time compiled kernel (see build_aot.py), then a Numba
+# kernel specialized per lens prescription (see _raytrace_codegen.py)
+try:
+    from ._raytrace_aot import trace_batch_f64 as _aot_trace_batch
+except ImportError:
+    _aot_trace_batch = None
+
+# GPU kernel, opt-in with POTK_BACKEND=cuda (see _raytrace_cuda.py)
+if os.environ.get('POTK_BACKEND', '').lower() == 'cuda':
+    from ._raytrace_cuda import HAS_CUDA as _USE_CUDA
+else:
+    _USE_CUDA = False
+
+# Below this many rays the NumPy path wins: compiling a kernel for a new
+# prescription costs far more than tracing a small batch
+_KERNEL_MIN_RAYS = 2048
+
 
 class SimpleLensElement:
     """
     Represents a single lens element (surface)
     """
 
+    __slots__ = ('radius', 'thickness', 'material', 'diameter')
+
+    # Refractive indices (simplified - wavelength 550nm), shared by all elements
+    _INDEX_MAP = {
+        'air': 1.0,
+        'N-BK7': 1.5168,
+        'N-SK16': 1.6204,
+        'N-LAK21': 1.6405,
+        'SF5': 1.6727,
+        'N-SF6': 1.8052,
+        'N-LASF9': 1.8501
+    }
+
     def __init__(self, radius: float, thickness: float,
                  material: str = 'air', diameter: float = 50.0):
         """
@@ -33,17 +71,6 @@ class SimpleLensElement:
         self.material = material
         self.diameter = diameter
 
-        # Refractive indices (simplified - wavelength 550nm)
-        self._index_map = {
-            'air': 1.0,
-            'N-BK7': 1.5168,
-            'N-SK16': 1.6204,
-            'N-LAK21': 1.6405,
-            'SF5': 1.6727,
-            'N-SF6': 1.8052,
-            'N-LASF9': 1.8501
-        }
-
     def get_index(self, wavelength: float = 550.0) -> float:
         """
         Get refractive index for wavelength
@@ -54,16 +81,29 @@ class SimpleLensElement:
         Returns:
             Refractive index
         """
-        base_index = self._index_map.get(self.material, 1.0)
+        return _dispersed_index(SimpleLensElement._INDEX_MAP.get(self.material, 1.0), wavelength)
 
-        # Simple dispersion model (Cauchy equation approximation)
-        if base_index > 1.0 and wavelength != 550.0:
-            # Adjust index based on wavelength
-            wl_factor = (550.0 / wavelength) ** 2
-            dispersion = (base_index - 1.0) * 0.01  # ~1% dispersion
-            base_index += dispersion * (wl_factor - 1.0)
 
-        return base_index
+@functools.lru_cache(maxsize=256)
+def _dispersed_index(base_index: float, wavelength: float) -> float:
+    """
+    Apply the simple dispersion model to a 550nm refractive index
+
+    Args:
+        base_index: Refractive index at 550nm
+        wavelength: Wavelength in nm
+
+    Returns:
+        Refractive index at wavelength
+    """
+    # Simple dispersion model (Cauchy equation approximation)
+    if base_index > 1.0 and wavelength != 550.0:
+        # Adjust index based on wavelength
+        wl_factor = (550.0 / wavelength) ** 2
+        dispersion = (base_index - 1.0) * 0.01  # ~1% dispersion
+        base_index += dispersion * (wl_factor - 1.0)
+
+    return base_index
 
 
 class SimpleRaytracer:
@@ -73,20 +113,63 @@ class SimpleRaytracer:
     Implements basic geometric optics using Snell's law for refraction.
     """
 
-    def __init__(self, lens_elements: List[SimpleLensElement]):
+    def __init__(self, lens_elements: List[SimpleLensElement], dtype=np.float32):
         """
         Args:
             lens_elements: List of lens elements (surfaces)
+            dtype: Floating point type for surface data and traced rays.
+                   float32 is plenty for fitting and preview; pass np.float64
+                   when validating against the C++ implementation.
         """
+        self.dtype = np.dtype(dtype)
+
+        # Element objects are kept for the constructor API; tracing reads
+        # the per-field arrays below (structure of arrays)
         self.elements = lens_elements
+        self.radius = np.fromiter((e.radius for e in lens_elements), dtype=self.dtype)
+        self.thickness = np.fromiter((e.thickness for e in lens_elements), dtype=self.dtype)
+        self.diameter = np.fromiter((e.diameter for e in lens_elements), dtype=self.dtype)
+        self.material = np.array([e.material for e in lens_elements], dtype=object)
+
+        # Base (550nm) refractive index per surface; per-wavelength index
+        # vectors are derived from it once and memoized per instance
+        self._base_idx = np.fromiter((e.get_index() for e in lens_elements), dtype=np.float64)
+        self._indices = functools.lru_cache(maxsize=32)(self._compute_indices)
+
+        # The focal length probe is deterministic for a fixed prescription
+        self._focal_lengths = functools.lru_cache(maxsize=8)(self._compute_focal_length)
+
+    def _compute_indices(self, wavelength: float) -> np.ndarray:
+        """
+        Refractive index after each surface at the given wavelength
+
+        Vectorized form of SimpleLensElement.get_index over all elements.
+
+        Args:
+            wavelength: Wavelength in nm
+
+        Returns:
+            Read-only array of refractive indices [S] in the tracer's dtype
+        """
+        indices = self._base_idx.copy()
+
+        if wavelength != 550.0:
+            wl_factor = (550.0 / wavelength) ** 2
+            glass = indices > 1.0
+            indices[glass] += (indices[glass] - 1.0) * 0.01 * (wl_factor - 1.0)
+
+        indices = indices.astype(self.dtype)
+        indices.setflags(write=False)
+        return indices
 
     @classmethod
-    def from_lens_data(cls, lens_data: dict) -> 'SimpleRaytracer':
+    def from_lens_data(cls, lens_data: dict, dtype=np.float32) -> 'SimpleRaytracer':
         """
         Create raytracer from lens design data
 
         Args:
             lens_data: Lens design dictionary
+            dtype: Floating point type (see __init__)
 
         Returns:
             SimpleRaytracer instance
@@ -102,7 +185,7 @@ class SimpleRaytracer:
             )
             elements.append(element)
 
-        return cls(elements)
+        return cls(elements, dtype=dtype)
 
     def trace_ray(self, ray_origin: np.ndarray, ray_direction: np.ndarray,
                   wavelength: float = 550.0) -> Tuple[Optional[np.ndarray],
@@ -118,81 +201,124 @@ class SimpleRaytracer:
         Returns:
             Tuple of (exit_position, exit_direction) or (None, None) if ray fails
         """
-        pos = ray_origin.copy()
-        direction = ray_direction / np.linalg.norm(ray_direction)
+        result = self.trace_ray_scalar(
+            float(ray_origin[0]), float(ray_origin[1]), float(ray_origin[2]),
+            float(ray_direction[0]), float(ray_direction[1]), float(ray_direction[2]),
+            wavelength
+        )
+        if result is None:
+            return None, None
+
+        return (np.array(result[:3], dtype=self.dtype),
+                np.array(result[3:], dtype=self.dtype))
+
+    def trace_ray_scalar(self, ox: float, oy: float, oz: float,
+                         dx: float, dy: float, dz: float,
+                         wavelength: float = 550.0) -> Optional[Tuple[float, ...]]:
+        """
+        Trace a single ray given as plain floats, without any array allocation
+
+        Args:
+            ox, oy, oz: Ray origin position in mm
+            dx, dy, dz: Ray direction
+            wavelength: Wavelength in nm
+
+        Returns:
+            Tuple of (px, py, pz, dx, dy, dz) at the exit surface, or None if ray fails
+        """
+        # Keep the ray in six scalar locals for the whole trace; each surface
+        # reads and writes them once with no temporary arrays in between
+        px, py, pz = ox, oy, oz
+        inv_len = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)
+        dx *= inv_len
+        dy *= inv_len
+        dz *= inv_len
         current_index = 1.0  # Air
 
         # Track cumulative position of surface vertices along optical axis
         z_vertex = 0.0
 
-        for i, element in enumerate(self.elements):
-            # Propagate to surface vertex plane (flat propagation)
-            if abs(direction[2]) < 1e-10:
-                return None, None  # Ray parallel to optical axis
+        surfaces = zip(self.radius.tolist(), self.thickness.tolist(),
+                       self.diameter.tolist(), self._indices(wavelength).tolist())
+        for radius, thickness, diameter, next_index in surfaces:
+            # (1) Propagate to surface vertex plane (flat propagation)
+            if abs(dz) < 1e-10:
+                return None  # Ray parallel to optical axis
 
-            t_to_vertex = (z_vertex - pos[2]) / direction[2]
+            t_to_vertex = (z_vertex - pz) / dz
             if t_to_vertex < -1e-6:
-                return None, None  # Surface behind ray
+                return None  # Surface behind ray
+
+            # (2) Position at vertex plane, checked against the clear aperture
+            # (squared radii on both sides, no sqrt needed)
+            vx = px + t_to_vertex * dx
+            vy = py + t_to_vertex * dy
+            r_sqr = vx * vx + vy * vy
+            half = diameter * 0.5
+            if r_sqr > half * half:
+                return None  # Vignetted
+
+            if abs(radius) > 1e-6:
+                # (3) Surface sag (deviation from flat) at this radial position
+                # Sagittal depth: sag = R - sqrt(R^2 - r^2) for R>0
+                radius_sqr = radius * radius
+                if r_sqr >= radius_sqr:
+                    return None  # Ray outside spherical surface
 
-            # Position at vertex plane
-            pos_at_vertex = pos + t_to_vertex * direction
+                if radius > 0:
+                    sag = radius - math.sqrt(radius_sqr - r_sqr)
+                else:
+                    sag = -abs(radius) + math.sqrt(radius_sqr - r_sqr)
 
-            # Check if ray is vignetted by aperture
-            r = np.sqrt(pos_at_vertex[0]**2 + pos_at_vertex[1]**2)
-            if r > element.diameter / 2:
-                return None, None  # Vignetted
+                # (4) Propagate to actual surface
+                t_to_surface = (z_vertex + sag - pz) / dz
+                px += t_to_surface * dx
+                py += t_to_surface * dy
+                pz += t_to_surface * dz
 
-            # Compute surface sag (deviation from flat) at this radial position
-            if abs(element.radius) > 1e-6:
-                # Sagittal depth: sag = R - sqrt(R^2 - r^2) for R>0
-                # For paraxial rays: sag ≈ r^2 / (2R)
-                r_sqr = r * r
-                if r_sqr < element.radius ** 2:
-                    if element.radius > 0:
-                        sag = element.radius - np.sqrt(element.radius ** 2 - r_sqr)
-                    else:
-                        sag = -abs(element.radius) + np.sqrt(element.radius ** 2 - r_sqr)
-                else:
-                    return None, None  # Ray outside spherical surface
-
-                # Actual surface position
-                z_surface = z_vertex + sag
-
-                # Propagate to actual surface
-                t_to_surface = (z_surface - pos[2]) / direction[2]
-                pos = pos + t_to_surface * direction
-
-                # Compute surface normal at this point
-                # For sphere: normal points from center to surface point
-                dx = pos[0]
-                dy = pos[1]
-                dz = sag
-                normal = np.array([dx, dy, dz])
-                normal_len = np.linalg.norm(normal)
+                # (5) Surface normal points from center to surface point
+                normal_len = math.sqrt(px * px + py * py + sag * sag)
                 if normal_len > 1e-10:
-                    normal = normal / normal_len
-                    if element.radius < 0:
-                        normal = -normal
+                    inv_len = 1.0 / normal_len
+                    if radius < 0:
+                        inv_len = -inv_len
+                    nx = px * inv_len
+                    ny = py * inv_len
+                    nz = sag * inv_len
                 else:
-                    normal = np.array([0, 0, 1])  # Normal for flat surface
+                    nx, ny, nz = 0.0, 0.0, 1.0  # Normal for flat surface
             else:
                 # Flat surface
-                pos = pos_at_vertex
-                normal = np.array([0, 0, 1])
-
-            # Refract at surface (Snell's law)
-            next_index = element.get_index(wavelength)
-
-            direction = self._refract(direction, normal, current_index, next_index)
-            if direction is None:
-                return None, None  # Total internal reflection
-
+                px = vx
+                py = vy
+                pz += t_to_vertex * dz
+                nx, ny, nz = 0.0, 0.0, 1.0
+
+            # (6) Refract at surface (Snell's law, see _refract)
+            cos_i = -(dx * nx + dy * ny + dz * nz)
+            if cos_i < 0:
+                # Ray coming from the other side of the surface
+                cos_i = -cos_i
+                nx, ny, nz = -nx, -ny, -nz
+
+            eta = current_index / next_index
+            k = 1.0 - eta * eta * (1.0 - cos_i * cos_i)
+            if k < 0:
+                return None  # Total internal reflection
+
+            scale = eta * cos_i - math.sqrt(k)
+            dx = eta * dx + scale * nx
+            dy = eta * dy + scale * ny
+            dz = eta * dz + scale * nz
+
+            # (7) Advance vertex position by thickness to next surface
             current_index = next_index
+            z_vertex += thickness
 
-            # Advance vertex position by thickness to next surface
-            z_vertex += element.thickness
-
-        return pos, direction
+        # Refraction of a unit ray about a unit normal stays unit length;
+        # renormalize once here to drop the accumulated roundoff
+        inv_len = 1.0 / math.sqrt(dx * dx + dy * dy + dz * dz)
+        return px, py, pz, dx * inv_len, dy * inv_len, dz * inv_len
 
     def trace_rays_batch(self, ray_origins: np.ndarray, ray_directions: np.ndarray,
                         wavelength: float = 550.0) -> Tuple[np.ndarray, np.ndarray]:
@@ -208,95 +334,284 @@ class SimpleRaytracer:
             Tuple of (exit_positions, exit_directions) [N, 3]
         """
         num_rays = ray_origins.shape[0]
-        exit_pos = np.zeros((num_rays, 3))
-        exit_dir = np.zeros((num_rays, 3))
-
-        for i in range(num_rays):
-            pos, direction = self.trace_ray(ray_origins[i], ray_directions[i], wavelength)
 
-            if pos is not None:
-                exit_pos[i] = pos
-                exit_dir[i] = direction
-            else:
-                # Mark failed ray
-                exit_pos[i] = np.array([np.nan, np.nan, np.nan])
-                exit_dir[i] = np.array([np.nan, np.nan, np.nan])
+        if _USE_CUDA and num_rays >= _KERNEL_MIN_RAYS:
+            from ._raytrace_cuda import get_cuda_kernel, trace_batch_cuda
+            kernel = get_cuda_kernel(
+                tuple(self.radius.tolist()),
+                tuple(self.thickness.tolist()),
+                tuple(self.diameter.tolist())
+            )
+            return trace_batch_cuda(kernel, ray_origins, ray_directions,
+                                    self._indices(wavelength), self.dtype)
+
+        if _aot_trace_batch is not None:
+            # The AOT module is built for float64 only
+            exit_pos = np.zeros((num_rays, 3))
+            exit_dir = np.zeros((num_rays, 3))
+            _aot_trace_batch(
+                np.ascontiguousarray(ray_origins, dtype=np.float64),
+                np.ascontiguousarray(ray_directions, dtype=np.float64),
+                self.radius.astype(np.float64),
+                self.thickness.astype(np.float64),
+                self.diameter.astype(np.float64),
+                self._indices(wavelength).astype(np.float64),
+                exit_pos, exit_dir
+            )
+            return exit_pos.astype(self.dtype, copy=False), exit_dir.astype(self.dtype, copy=False)
+
+        exit_pos = np.zeros((num_rays, 3), dtype=self.dtype)
+        exit_dir = np.zeros((num_rays, 3), dtype=self.dtype)
+
+        if HAS_NUMBA and num_rays >= _KERNEL_MIN_RAYS:
+            # Compiled on first use for this prescription; the wavelength
+            # only changes the index array passed in
+            kernel = get_specialized_kernel(
+                tuple(self.radius.tolist()),
+                tuple(self.thickness.tolist()),
+                tuple(self.diameter.tolist())
+            )
+            kernel(np.ascontiguousarray(ray_origins, dtype=self.dtype),
+                   np.ascontiguousarray(ray_directions, dtype=self.dtype),
+                   self._indices(wavelength).astype(np.float64),
+                   exit_pos, exit_dir)
+            return exit_pos, exit_dir
+
+        if num_rays <= 10_000:
+            self._trace_chunk_vectorized(ray_origins, ray_directions, wavelength,
+                                         exit_pos, exit_dir)
+            return exit_pos, exit_dir
+
+        # NumPy ufuncs release the GIL, so contiguous chunks traced in
+        # threads (writing into views of the outputs) scale across cores
+        workers = os.cpu_count() or 1
+        bounds = np.linspace(0, num_rays, workers + 1).astype(int)
+        chunks = [slice(lo, hi) for lo, hi in zip(bounds[:-1], bounds[1:]) if hi > lo]
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(
+                lambda ch: self._trace_chunk_vectorized(
+                    ray_origins[ch], ray_directions[ch], wavelength,
+                    exit_pos[ch], exit_dir[ch]),
+                chunks
+            ))
 
         return exit_pos, exit_dir
 
-    def _intersect_sphere_at(self, ray_origin: np.ndarray, ray_dir: np.ndarray,
-                            sphere_center: np.ndarray, radius: float) -> Optional[float]:
+    def _trace_chunk_vectorized(self, ray_origins: np.ndarray, ray_directions: np.ndarray,
+                                wavelength: float, out_pos: np.ndarray, out_dir: np.ndarray):
         """
-        Intersect ray with sphere at given center and radius
+        Trace a chunk of rays with NumPy array math, one pass per surface
+
+        Same steps as trace_ray, applied to all rays at once; rays that fail
+        at any surface are masked out and written as NaN.
 
         Args:
-            ray_origin: Ray origin [x, y, z]
-            ray_dir: Ray direction [dx, dy, dz] (normalized)
-            sphere_center: Sphere center [x, y, z]
+            ray_origins: Ray origins [N, 3]
+            ray_directions: Ray directions [N, 3]
+            wavelength: Wavelength in nm
+            out_pos: Output exit positions [N, 3] (written in place)
+            out_dir: Output exit directions [N, 3] (written in place)
+        """
+        # Transpose to SoA once: each component becomes a contiguous row
+        # instead of a stride-3 column view
+        px, py, pz = np.ascontiguousarray(ray_origins.T, dtype=self.dtype)
+        dx, dy, dz = np.ascontiguousarray(ray_directions.T, dtype=self.dtype)
+        inv_len = 1.0 / np.sqrt(dx * dx + dy * dy + dz * dz)
+        dx = dx * inv_len
+        dy = dy * inv_len
+        dz = dz * inv_len
+
+        # Positions of the rays still in the arrays within the chunk
+        ray_idx = np.arange(px.shape[0])
+        alive = np.ones(px.shape[0], dtype=bool)
+        current_index = 1.0
+        z_vertex = 0.0
+
+        # Failed rays carry inf/NaN through the remaining surfaces until the
+        # arrays are compacted
+        with np.errstate(divide='ignore', invalid='ignore'):
+            surfaces = zip(self.radius.tolist(), self.thickness.tolist(),
+                           self.diameter.tolist(), self._indices(wavelength).tolist())
+            for radius, thickness, diameter, next_index in surfaces:
+                alive &= np.abs(dz) >= 1e-10
+                t_to_vertex = (z_vertex - pz) / dz
+                alive &= t_to_vertex >= -1e-6
+
+                vx = px + t_to_vertex * dx
+                vy = py + t_to_vertex * dy
+                r_sqr = vx * vx + vy * vy
+                half = diameter * 0.5
+                alive &= r_sqr <= half * half
+
+                if abs(radius) > 1e-6:
+                    radius_sqr = radius * radius
+                    alive &= r_sqr < radius_sqr
+
+                    if radius > 0:
+                        sag = radius - np.sqrt(radius_sqr - r_sqr)
+                    else:
+                        sag = -abs(radius) + np.sqrt(radius_sqr - r_sqr)
+
+                    t_to_surface = (z_vertex + sag - pz) / dz
+                    px = px + t_to_surface * dx
+                    py = py + t_to_surface * dy
+                    pz = pz + t_to_surface * dz
+
+                    normal_len = np.sqrt(px * px + py * py + sag * sag)
+                    inv_len = 1.0 / normal_len
+                    if radius < 0:
+                        inv_len = -inv_len
+                    degenerate = normal_len <= 1e-10
+                    nx = np.where(degenerate, 0.0, px * inv_len)
+                    ny = np.where(degenerate, 0.0, py * inv_len)
+                    nz = np.where(degenerate, 1.0, sag * inv_len)
+                else:
+                    px = vx
+                    py = vy
+                    pz = pz + t_to_vertex * dz
+                    nx, ny, nz = 0.0, 0.0, 1.0
+
+                cos_i = -(dx * nx + dy * ny + dz * nz)
+                flip = cos_i < 0
+                cos_i = np.abs(cos_i)
+                nx = np.where(flip, -nx, nx)
+                ny = np.where(flip, -ny, ny)
+                nz = np.where(flip, -nz, nz)
+
+                eta = current_index / next_index
+                k = 1.0 - eta * eta * (1.0 - cos_i * cos_i)
+                alive &= k >= 0
+
+                scale = eta * cos_i - np.sqrt(k)
+                dx = eta * dx + scale * nx
+                dy = eta * dy + scale * ny
+                dz = eta * dz + scale * nz
+
+                current_index = next_index
+                z_vertex += thickness
+
+                # Stream compaction: once most rays have failed, drop them so
+                # the remaining surfaces only process survivors
+                if np.count_nonzero(alive) < alive.size // 2:
+                    px, py, pz = px[alive], py[alive], pz[alive]
+                    dx, dy, dz = dx[alive], dy[alive], dz[alive]
+                    ray_idx = ray_idx[alive]
+                    alive = np.ones(ray_idx.size, dtype=bool)
+
+        # Directions stay unit length through refraction; renormalize once
+        inv_len = 1.0 / np.sqrt(dx * dx + dy * dy + dz * dz)
+        dx = dx * inv_len
+        dy = dy * inv_len
+        dz = dz * inv_len
+
+        out_pos[:] = np.nan
+        out_dir[:] = np.nan
+        live = ray_idx[alive]
+        out_pos[live, 0] = px[alive]
+        out_pos[live, 1] = py[alive]
+        out_pos[live, 2] = pz[alive]
+        out_dir[live, 0] = dx[alive]
+        out_dir[live, 1] = dy[alive]
+        out_dir[live, 2] = dz[alive]
+
+    def _intersect_sphere_at(self, px: float, py: float, pz: float,
+                            dx: float, dy: float, dz: float,
+                            cz: float, radius: float) -> Optional[Tuple[float, float, float, float]]:
+        """
+        Intersect ray with sphere centred on the optical axis
+
+        Args:
+            px, py, pz: Ray origin
+            dx, dy, dz: Ray direction (normalized)
+            cz: Sphere centre position along the optical axis
             radius: Sphere radius
 
         Returns:
-            Distance t to intersection, or None if no intersection
+            Tuple of (t, nx, ny, nz) - distance to intersection and outward
+            surface normal - or None if no intersection
         """
         # Vector from sphere center to ray origin
-        oc = ray_origin - sphere_center
+        ocx, ocy, ocz = px, py, pz - cz
 
-        a = np.dot(ray_dir, ray_dir)
-        b = 2.0 * np.dot(oc, ray_dir)
-        c = np.dot(oc, oc) - radius ** 2
+        # Unit direction, so the quadratic's a == 1; use the half-b form
+        half_b = ocx * dx + ocy * dy + ocz * dz
+        c = ocx * ocx + ocy * ocy + ocz * ocz - radius * radius
 
-        discriminant = b ** 2 - 4 * a * c
+        discriminant = half_b * half_b - c
 
         if discriminant < 0:
             return None  # No intersection
 
         # Take closest positive intersection
-        sqrt_d = np.sqrt(discriminant)
-        t1 = (-b - sqrt_d) / (2 * a)
-        t2 = (-b + sqrt_d) / (2 * a)
+        sqrt_d = math.sqrt(discriminant)
+        t1 = -half_b - sqrt_d
+        t2 = -half_b + sqrt_d
 
-        # Return the nearest positive intersection
+        # Use the nearest positive intersection
         if t1 > 1e-6:
-            return t1
+            t = t1
         elif t2 > 1e-6:
-            return t2
-
-        return None
-
-    def _refract(self, incident: np.ndarray, normal: np.ndarray,
-                 n1: float, n2: float) -> Optional[np.ndarray]:
+            t = t2
+        else:
+            return None
+
+        inv_r = 1.0 / abs(radius)
+        return (t,
+                (ocx + t * dx) * inv_r,
+                (ocy + t * dy) * inv_r,
+                (ocz + t * dz) * inv_r)
+
+    def _refract(self, ix: float, iy: float, iz: float,
+                 nx: float, ny: float, nz: float,
+                 n1: float, n2: float) -> Optional[Tuple[float, float, float]]:
         """
         Compute refracted ray direction using Snell's law
 
         Args:
-            incident: Incident ray direction (normalized)
-            normal: Surface normal (normalized)
+            ix, iy, iz: Incident ray direction (normalized)
+            nx, ny, nz: Surface normal (normalized)
             n1: Refractive index of incident medium
             n2: Refractive index of refracted medium
 
         Returns:
-            Refracted direction, or None if total internal reflection
+            Refracted direction (rx, ry, rz), or None if total internal reflection
         """
-        cos_i = -np.dot(incident, normal)
+        cos_i = -(ix * nx + iy * ny + iz * nz)
 
         # Handle ray coming from either side of surface
         if cos_i < 0:
             cos_i = -cos_i
-            normal = -normal
+            nx, ny, nz = -nx, -ny, -nz
 
         eta = n1 / n2
-        k = 1.0 - eta ** 2 * (1.0 - cos_i ** 2)
+        k = 1.0 - eta * eta * (1.0 - cos_i * cos_i)
 
         if k < 0:
             return None  # Total internal reflection
 
-        refracted = eta * incident + (eta * cos_i - np.sqrt(k)) * normal
-        return refracted / np.linalg.norm(refracted)
+        # Unit length already (to roundoff) for unit incident and normal
+        scale = eta * cos_i - math.sqrt(k)
+        return eta * ix + scale * nx, eta * iy + scale * ny, eta * iz + scale * nz
 
     def compute_focal_length(self, samples: int = 100) -> float:
         """
         Estimate focal length by tracing parallel rays
 
+        The result is memoized per sample count.
+
+        Args:
+            samples: Number of ray samples
+
+        Returns:
+            Estimated focal length in mm
+        """
+        return self._focal_lengths(int(samples))
+
+    def _compute_focal_length(self, samples: int) -> float:
+        """
+        Trace the collimated ray fan behind compute_focal_length
+
         Args:
             samples: Number of ray samples
 
@@ -307,27 +622,15 @@ class SimpleRaytracer:
         ray_origins = np.zeros((samples, 3))
         ray_origins[:, 0] = np.linspace(-5, 5, samples)  # Spread across 10mm diameter
 
-        ray_directions = np.tile([0, 0, 1], (samples, 1))
+        # All rays share one direction: a read-only broadcast view, not a copy
+        ray_directions = np.broadcast_to(np.array([0.0, 0.0, 1.0]), (samples, 3))
 
         exit_pos, exit_dir = self.trace_rays_batch(ray_origins, ray_directions)
 
         # Find where rays cross optical axis (z-axis)
-        # Focal point: where x=0, y=0
-
-        valid = ~np.isnan(exit_pos[:, 0])
-        if not np.any(valid):
-            return 0.0
-
-        # Compute focal point as average crossing point
-        focal_distances = []
-        for i in np.where(valid)[0]:
-            # How far along ray until x=0?
-            if abs(exit_dir[i, 0]) > 1e-6:
-                t = -exit_pos[i, 0] / exit_dir[i, 0]
-                focal_z = exit_pos[i, 2] + t * exit_dir[i, 2]
-                focal_distances.append(focal_z)
-
-        if focal_distances:
-            return np.mean(focal_distances)
+        # Focal point: where x=0, y=0 - average of each ray's crossing z
+        valid = ~np.isnan(exit_pos[:, 0]) & (np.abs(exit_dir[:, 0]) > 1e-6)
+        t = -exit_pos[valid, 0] / exit_dir[valid, 0]
+        focal_z = exit_pos[valid, 2] + t * exit_dir[valid, 2]
 
-        return 0.0
+        return float(focal_z.mean()) if focal_z.size else 0.0
@@ -10,9 +10,24 @@ Each lens gets a custom-generated shader with:
 - Chromatic aberration support
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional
+import functools
 import json
+import re
+
+import numpy as np
+
+
+# Template placeholders such as {LENS_NAME}
+_SUBST_RE = re.compile(r'\{([A-Z_]+)\}')
+
+# Shader index written next to batch-generated shaders
+INDEX_FILENAME = 'index.json'
+
+# First line of generated shaders: lens parameters as one JSON object
+META_PREFIX = '// POTK_META '
 
 
 class VEXGenerator:
@@ -22,12 +37,16 @@ class VEXGenerator:
     Generates per-lens optimized VEX shaders from polynomial coefficients.
     """
 
+    # Template sources shared by all instances, keyed by template path
+    _TEMPLATE_CACHE: Dict[str, str] = {}
+
     def __init__(self, template_dir: Optional[Path] = None):
         """
         Initialize VEX generator
 
         Args:
-            template_dir: Path to VEX template directory
+            template_dir: Path to VEX template directory (default: vex/templates
+                          in the checkout, so only editable installs find it)
         """
         if template_dir is None:
             template_dir = Path(__file__).parent.parent.parent / 'vex' / 'templates'
@@ -44,17 +63,28 @@ class VEXGenerator:
         """
         template_path = self.template_dir / template_name
 
+        cache_key = str(template_path)
+        if cache_key in self._TEMPLATE_CACHE:
+            self._template = self._TEMPLATE_CACHE[cache_key]
+            return
+
         if not template_path.exists():
-            raise FileNotFoundError(f"Template not found: {template_path}")
+            raise FileNotFoundError(
+                f"Template not found: {template_path} (templates are read from the "
+                f"checkout's vex/templates; install with 'pip install -e .' or pass template_dir)"
+            )
 
         with open(template_path, 'r') as f:
             self._template = f.read()
 
+        self._TEMPLATE_CACHE[cache_key] = self._template
+
         print(f"Loaded VEX template: {template_name}")
 
     @classmethod
     def generate(cls, lens_data: Dict, coefficients: Dict[str, List[float]],
-                 output_path: Optional[Path] = None) -> str:
+                 output_path: Optional[Path] = None,
+                 generator: Optional['VEXGenerator'] = None) -> str:
         """
         Generate optimized VEX shader for a specific lens
 
@@ -62,11 +92,13 @@ class VEXGenerator:
             lens_data: Lens metadata (name, focal length, etc.)
             coefficients: Polynomial coefficients
             output_path: Optional path to save generated shader
+            generator: Existing generator to reuse (keeps its loaded template)
 
         Returns:
             Generated VEX shader code
         """
-        generator = cls()
+        if generator is None:
+            generator = cls()
 
         # Generate shader code
         shader_code = generator._generate_shader(lens_data, coefficients)
@@ -108,20 +140,28 @@ class VEXGenerator:
         # Generate polynomial evaluation code
         poly_eval_code = self._generate_polynomial_evaluation(degree)
 
-        # Template substitution
-        shader_code = self._template
-        shader_code = shader_code.replace('{LENS_NAME}', lens_name)
-        shader_code = shader_code.replace('{FOCAL_LENGTH}', str(focal_length))
-        shader_code = shader_code.replace('{MAX_FSTOP}', str(max_fstop))
-        shader_code = shader_code.replace('{POLYNOMIAL_DEGREE}', str(degree))
-        shader_code = shader_code.replace('{COEFFS_X}', coeffs_x_str)
-        shader_code = shader_code.replace('{COEFFS_Y}', coeffs_y_str)
-        shader_code = shader_code.replace('{POLY_EVAL_CODE}', poly_eval_code)
+        # Template substitution (single pass; unknown placeholders are kept)
+        subs = {
+            'LENS_NAME': lens_name,
+            'FOCAL_LENGTH': str(focal_length),
+            'MAX_FSTOP': str(max_fstop),
+            'POLYNOMIAL_DEGREE': str(degree),
+            'COEFFS_X': coeffs_x_str,
+            'COEFFS_Y': coeffs_y_str,
+            'POLY_EVAL_CODE': poly_eval_code,
+        }
+        shader_code = _SUBST_RE.sub(lambda m: subs.get(m.group(1), m.group(0)), self._template)
+
+        # Machine-readable header so tools can read the lens parameters
+        # from the first line instead of scanning the comment block
+        meta = {'name': lens_name, 'focal': focal_length, 'fstop': max_fstop, 'degree': degree}
+        shader_code = f"{META_PREFIX}{json.dumps(meta)}\n{shader_code}"
 
         print(f"\nGenerated VEX shader for: {lens_data.get('name', 'unknown')}")
         print(f"  Polynomial degree: {degree}")
         print(f"  Coefficients: {len(coeffs_x)} per direction")
-        print(f"  Lines of code: {len(shader_code.splitlines())}")
+        num_lines = shader_code.count('\n') + 1
+        print(f"  Lines of code: {num_lines}")
 
         return shader_code
 
@@ -135,16 +175,19 @@ class VEXGenerator:
         Returns:
             VEX array string
         """
+        # VEX floats are single precision: round to float32 here and print
+        # just enough digits (9 significant) to round-trip it exactly
+        single = np.asarray(coefficients, dtype=np.float32)
+
         # Format with 4 coefficients per line for readability
-        lines = []
-        for i in range(0, len(coefficients), 4):
-            chunk = coefficients[i:i+4]
-            line = ', '.join(f'{c:.10e}' for c in chunk)
-            lines.append(f'        {line}')
+        formatted = [f'{c:.8e}' for c in single.tolist()]
+        lines = [', '.join(formatted[i:i+4]) for i in range(0, len(formatted), 4)]
 
-        return ',\n'.join(lines)
+        return ',\n'.join('        ' + line for line in lines)
 
-    def _generate_polynomial_evaluation(self, degree: int) -> str:
+    @staticmethod
+    @functools.lru_cache(maxsize=16)
+    def _generate_polynomial_evaluation(degree: int) -> str:
         """
         Generate optimized polynomial evaluation code
 
@@ -154,38 +197,60 @@ class VEXGenerator:
         Returns:
             VEX code for evaluating polynomial
         """
-        # TODO: Generate Horner's method or optimized evaluation
-        # This could be degree-specific for maximum performance
-
-        code = f"""
-    // Evaluate degree-{degree} polynomial using Horner's method
-    // This is a placeholder - will be optimized per lens
-    float eval_poly(float coeffs[]; float x; float y)
-    {{
-        // TODO: Implement optimized evaluation
-        return 0.0;
-    }}
-"""
-        return code
-
-    def save_shader(self, shader_code: str, output_path: Path):
+        # Coefficient index of x^i * y^j, matching the fitter's feature order
+        # (by total degree, then by power of x)
+        def index(i, j):
+            total_deg = i + j
+            return total_deg * (total_deg + 1) // 2 + i
+
+        # Nested Horner form, fully unrolled:
+        #   P(x, y) = sum_i x^i * P_i(y),  P_i(y) = sum_j c_ij * y^j
+        # evaluated as (((P_D)*x + P_{D-1})*x + ...) with each P_i in Horner form in y
+        lines = [
+            f"// Degree-{degree} polynomial, unrolled nested Horner evaluation",
+            f"float eval_poly_deg{degree}(float coeffs[]; float x; float y)",
+            "{",
+            f"    float r = coeffs[{index(degree, 0)}];",
+            "    float p;",
+        ]
+
+        for i in range(degree - 1, -1, -1):
+            lines.append(f"    p = coeffs[{index(i, degree - i)}];")
+            for j in range(degree - i - 1, -1, -1):
+                lines.append(f"    p = p * y + coeffs[{index(i, j)}];")
+            lines.append("    r = r * x + p;")
+
+        lines += [
+            "    return r;",
+            "}",
+        ]
+
+        return '\n'.join(lines)
+
+    def save_shader(self, shader_code: str, output_path: Path) -> int:
         """
         Save generated shader to file
 
         Args:
             shader_code: VEX shader code
             output_path: Output file path
+
+        Returns:
+            Number of bytes written
         """
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w') as f:
-            f.write(shader_code)
+        data = shader_code.encode('utf-8')
+        output_path.write_bytes(data)
+
+        print(f"  Saved shader to: {output_path} ({len(data)} bytes)")
 
-        print(f"  Saved shader to: {output_path}")
+        return len(data)
 
     def generate_batch(self, lens_database: Dict[str, Dict],
                       output_dir: Path,
-                      overwrite: bool = False):
+                      overwrite: bool = False,
+                      jobs: int = 1):
         """
         Generate VEX shaders for multiple lenses
 
@@ -193,12 +258,21 @@ class VEXGenerator:
             lens_database: Dictionary of lens_id -> lens_data
             output_dir: Output directory for generated shaders
             overwrite: Whether to overwrite existing shaders
+            jobs: Number of worker processes (shader generation is pure
+                  Python string work, so threads would serialize on the GIL)
         """
         print(f"\nGenerating VEX shaders for {len(lens_database)} lenses...")
 
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        generated = 0
+        # Read the template once for the whole batch
+        if self._template is None:
+            self.load_template()
+
+        # Keep index entries of shaders that are skipped below
+        index = self.read_index(output_dir)
+
+        pending = []
         skipped = 0
 
         for lens_id, lens_data in lens_database.items():
@@ -210,9 +284,157 @@ class VEXGenerator:
                 skipped += 1
                 continue
 
-            coefficients = lens_data.get('coefficients', {})
-            shader_code = self._generate_shader(lens_data, coefficients)
-            self.save_shader(shader_code, output_path)
-            generated += 1
+            pending.append((lens_name, lens_data, output_path))
+
+        if jobs > 1 and len(pending) > 1:
+            # Workers get the template text, so they don't re-read it
+            with ProcessPoolExecutor(max_workers=min(jobs, len(pending))) as executor:
+                mtimes = list(executor.map(
+                    _generate_batch_item,
+                    [self.template_dir] * len(pending),
+                    [self._template] * len(pending),
+                    [lens_data for _, lens_data, _ in pending],
+                    [output_path for _, _, output_path in pending],
+                ))
+        else:
+            mtimes = [
+                _generate_batch_item(self.template_dir, self._template, lens_data, output_path,
+                                     generator=self)
+                for _, lens_data, output_path in pending
+            ]
+
+        for (lens_name, lens_data, _), mtime in zip(pending, mtimes):
+            index[lens_name] = {
+                'focal': lens_data.get('focal_length', 50.0),
+                'fstop': lens_data.get('max_fstop', 2.8),
+                'degree': lens_data.get('polynomial_degree', 7),
+                'mtime': mtime,
+            }
+
+        generated = len(pending)
+
+        with open(output_dir / INDEX_FILENAME, 'w') as f:
+            json.dump({'shaders': index}, f, indent=2)
 
         print(f"\n✓ Generated {generated} shaders, skipped {skipped}")
+
+    @staticmethod
+    def read_shader_meta(shader_path: Path) -> Optional[Dict]:
+        """
+        Read the lens parameters of a generated shader
+
+        Uses the POTK_META first line; shaders generated before it existed
+        fall back to parsing the header comment.
+
+        Args:
+            shader_path: Path to a generated .vfl file
+
+        Returns:
+            Dictionary with 'focal', 'fstop' and 'degree' (and 'name' when
+            available), or None if the file has neither header
+        """
+        with open(shader_path, 'r') as f:
+            first = f.readline()
+            if first.startswith(META_PREFIX):
+                try:
+                    return json.loads(first[len(META_PREFIX):])
+                except ValueError:
+                    return None
+
+            # Legacy header: " * Focal length: 50.0mm" etc. in the first comment
+            meta = {}
+            try:
+                for line in (first, *f):
+                    if 'Focal length:' in line:
+                        meta['focal'] = float(line.split(':', 1)[1].strip().rstrip('m'))
+                    elif 'Max f-stop:' in line:
+                        meta['fstop'] = float(line.split(':', 1)[1].strip().lstrip('f/'))
+                    elif 'Polynomial degree:' in line:
+                        meta['degree'] = int(line.split(':', 1)[1])
+                    elif '*/' in line:
+                        break
+            except ValueError:
+                return None
+
+        return meta if len(meta) == 3 else None
+
+    @staticmethod
+    def read_index(vex_dir: Path) -> Dict[str, Dict]:
+        """
+        Read the shader index of a directory of generated shaders
+
+        Lets callers list shaders and their lens parameters without opening
+        every .vfl file. Entries whose shader is missing are dropped; shaders
+        that were modified after indexing, or never indexed, are read with
+        read_shader_meta instead.
+
+        Args:
+            vex_dir: Directory written by generate_batch
+
+        Returns:
+            Dictionary of shader name -> {'focal', 'fstop', 'degree', 'mtime'}
+            (shaders without a readable header are left out)
+        """
+        vex_dir = Path(vex_dir)
+
+        try:
+            with open(vex_dir / INDEX_FILENAME, 'r') as f:
+                shaders = json.load(f)['shaders']
+            if not isinstance(shaders, dict):
+                shaders = {}
+        except (OSError, ValueError, KeyError, TypeError):
+            shaders = {}
+
+        index = {}
+        for shader_path in vex_dir.glob('*.vfl'):
+            name = shader_path.stem
+            try:
+                mtime = shader_path.stat().st_mtime
+            except OSError:
+                continue
+
+            entry = shaders.get(name)
+            if isinstance(entry, dict) and entry.get('mtime') == mtime:
+                index[name] = entry
+                continue
+
+            try:
+                meta = VEXGenerator.read_shader_meta(shader_path)
+            except (OSError, UnicodeDecodeError):
+                meta = None
+            if meta is not None:
+                index[name] = {
+                    'focal': meta.get('focal'),
+                    'fstop': meta.get('fstop'),
+                    'degree': meta.get('degree'),
+                    'mtime': mtime,
+                }
+
+        return index
+
+
+def _generate_batch_item(template_dir: Path, template: str, lens_data: Dict,
+                         output_path: Path,
+                         generator: Optional[VEXGenerator] = None) -> float:
+    """
+    Generate and save one shader of a batch (module level so worker
+    processes can run it)
+
+    Args:
+        template_dir: VEX template directory
+        template: Loaded template source
+        lens_data: Lens data including coefficients
+        output_path: Output shader path
+        generator: Generator to reuse when running in-process
+
+    Returns:
+        Modification time of the written shader
+    """
+    if generator is None:
+        generator = VEXGenerator(template_dir)
+        generator._template = template
+
+    VEXGenerator.generate(lens_data, lens_data.get('coefficients', {}), output_path,
+                          generator=generator)
+
+    return output_path.stat().st_mtime
@@ -4,9 +4,50 @@ Setup Lentil Camera in LOPs/Solaris for Karma
 Complete LOP-based workflow for Karma rendering
 """
 
+import functools
+import os
+from dataclasses import dataclass
+from typing import Optional, Union
+
 import hou
 
 
+# Pre-serialized copy of the network built by _build_lop_nodes (written with
+# save_lop_network_snippet); when present it is loaded in a single call
+_NETWORK_SNIPPET = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    'otls', 'lentil_lop_network.cpio'
+)
+
+# Default lentil camera parameters
+_CAMERA_DEFAULTS = {
+    'resx': 1920,
+    'resy': 1080,
+    'focal': 50.0,        # 50mm
+    'aperture': 41.4214,  # Full frame horizontal aperture
+    'focus': 5.0,         # 5 meters focus distance
+    'fstop': 2.8,         # f/2.8
+    # Transform
+    'tx': 0,
+    'ty': 1,
+    'tz': 5,
+}
+
+# Default Karma render settings
+_KARMA_DEFAULTS = {
+    'camera': '/cameras/lentil_camera',
+    'res_overrideres': 1,
+    'res_resx': 1920,
+    'res_resy': 1080,
+    # Sampling
+    'pixelsamples': 1024,  # 32x32 for smooth bokeh
+}
+
+# Node names inside the LOP network, in chain order
+_NODE_NAMES = ('lentil_camera', 'sphere_foreground', 'sphere_background',
+               'ground', 'dome_light', 'karma_settings', 'render')
+
+
 def create_lentil_lop_network(name='lentil_stage'):
     """
     Create a complete LOP network with lentil camera for Karma
@@ -22,92 +63,31 @@ def create_lentil_lop_network(name='lentil_stage'):
     print("=" * 70)
     print()
 
-    # Create LOP network at stage level
-    stage = hou.node('/stage')
-    if not stage:
-        stage = hou.node('/').createNode('stage')
-
-    # Create LOP network
-    lop_network = stage.createNode('lopnet', name)
-
-    # Create nodes inside LOP network
-    # 1. Camera
-    camera = lop_network.createNode('camera', 'lentil_camera')
-
-    # Set camera parameters for lentil
-    camera.parm('resx').set(1920)
-    camera.parm('resy').set(1080)
-    camera.parm('focal').set(50.0)  # 50mm
-    camera.parm('aperture').set(41.4214)  # Full frame horizontal aperture
-    camera.parm('focus').set(5.0)  # 5 meters focus distance
-    camera.parm('fstop').set(2.8)  # f/2.8
-
-    # Transform
-    camera.parm('tx').set(0)
-    camera.parm('ty').set(1)
-    camera.parm('tz').set(5)
-
-    # 2. Create scene content (example geometry)
-    # Sphere 1 (foreground)
-    sphere1 = lop_network.createNode('sphere', 'sphere_foreground')
-    sphere1.setInput(0, camera)
-    sphere1.parm('primpath').set('/geo/sphere_fg')
-    sphere1.parm('radius').set(0.5)
-    sphere1.parm('tx').set(0)
-    sphere1.parm('ty').set(0)
-    sphere1.parm('tz').set(0)
+    # One undo entry for the whole setup
+    with hou.undos.group('Create Lentil LOP'):
+        # Create LOP network at stage level
+        stage = hou.node('/stage')
+        if not stage:
+            stage = hou.node('/').createNode('stage')
 
-    # Sphere 2 (background)
-    sphere2 = lop_network.createNode('sphere', 'sphere_background')
-    sphere2.setInput(0, sphere1)
-    sphere2.parm('primpath').set('/geo/sphere_bg')
-    sphere2.parm('radius').set(0.3)
-    sphere2.parm('tx').set(0)
-    sphere2.parm('ty').set(0)
-    sphere2.parm('tz').set(-3)
+        # Create LOP network
+        lop_network = stage.createNode('lopnet', name)
 
-    # 3. Ground plane
-    grid = lop_network.createNode('grid', 'ground')
-    grid.setInput(0, sphere2)
-    grid.parm('primpath').set('/geo/ground')
-    grid.parm('scale').set(10)
-    grid.parm('ty').set(-1)
+        # Undoing the network creation removes its children too, so the
+        # ~50 intermediate createNode/setInput/setParms records are skipped
+        with hou.undos.disabler():
+            # Snippet nodes arrive wired, configured and laid out
+            nodes = _load_lop_snippet(lop_network)
+            if nodes is None:
+                nodes = _build_lop_nodes(lop_network)
+                # Lay out only our nodes, once everything is wired
+                lop_network.layoutChildren(items=nodes)
 
-    # 4. Lights
-    dome_light = lop_network.createNode('domelight', 'dome_light')
-    dome_light.setInput(0, grid)
-    dome_light.parm('primpath').set('/lights/dome')
-    dome_light.parm('intensity').set(1.0)
+            camera, sphere1, sphere2, grid, dome_light, render_settings, karma_node = nodes
 
-    # 5. Karma render settings
-    render_settings = lop_network.createNode('karmarenderproperties', 'karma_settings')
-    render_settings.setInput(0, dome_light)
-
-    # Configure Karma settings
-    render_settings.parm('camera').set('/cameras/lentil_camera')
-    render_settings.parm('res_overrideres').set(1)
-    render_settings.parm('res_resx').set(1920)
-    render_settings.parm('res_resy').set(1080)
-
-    # Sampling
-    render_settings.parm('pixelsamples').set(1024)  # 32x32 for smooth bokeh
-
-    # 6. Configure Karma LOP
-    karma_node = lop_network.createNode('karma', 'render')
-    karma_node.setInput(0, render_settings)
-
-    # Set render camera
-    karma_node.parm('camera').set('/cameras/lentil_camera')
-
-    # Output
-    karma_node.parm('picture').set('$HIP/render/$HIPNAME.$F4.exr')
-
-    # 7. Set display flags
-    karma_node.setDisplayFlag(True)
-    karma_node.setRenderFlag(True)
-
-    # Layout
-    lop_network.layoutChildren()
+            # 7. Set display flags
+            karma_node.setDisplayFlag(True)
+            karma_node.setRenderFlag(True)
 
     print(f"✓ Created LOP network: {lop_network.path()}")
     print(f"✓ Camera: /cameras/lentil_camera")
@@ -156,6 +136,207 @@ def create_lentil_lop_network(name='lentil_stage'):
     return lop_network, camera
 
 
+def _load_lop_snippet(lop_network):
+    """
+    Load the lentil LOP nodes from the saved network snippet
+
+    A missing snippet, or one that fails to load or lacks any of the
+    expected nodes (e.g. saved by an older version), leaves the network
+    empty so the caller can build the nodes instead.
+
+    Args:
+        lop_network: Empty LOP network to load the nodes into
+
+    Returns:
+        List of nodes in _NODE_NAMES order, or None
+    """
+    if not os.path.exists(_NETWORK_SNIPPET):
+        return None
+
+    try:
+        lop_network.loadItemsFromFile(_NETWORK_SNIPPET)
+        nodes = [lop_network.node(node_name) for node_name in _NODE_NAMES]
+    except hou.Error as e:
+        print(f"⚠ Could not load LOP network snippet: {e}")
+        nodes = [None]
+
+    if None in nodes:
+        # Discard the partial load
+        for child in lop_network.children():
+            child.destroy()
+        return None
+
+    return nodes
+
+
+def _build_lop_nodes(lop_network):
+    """
+    Create and wire the lentil LOP nodes one by one
+
+    Args:
+        lop_network: LOP network to create the nodes in
+
+    Returns:
+        List of nodes in _NODE_NAMES order
+    """
+    # Create nodes inside LOP network
+    # 1. Camera
+    camera = lop_network.createNode('camera', 'lentil_camera')
+
+    # Set camera parameters for lentil (one setParms call per node)
+    camera.setParms(_CAMERA_DEFAULTS)
+
+    # 2. Create scene content (example geometry)
+    # Sphere 1 (foreground)
+    sphere1 = lop_network.createNode('sphere', 'sphere_foreground')
+    sphere1.setInput(0, camera)
+    sphere1.setParms({'primpath': '/geo/sphere_fg', 'radius': 0.5, 'tx': 0, 'ty': 0, 'tz': 0})
+
+    # Sphere 2 (background)
+    sphere2 = lop_network.createNode('sphere', 'sphere_background')
+    sphere2.setInput(0, sphere1)
+    sphere2.setParms({'primpath': '/geo/sphere_bg', 'radius': 0.3, 'tx': 0, 'ty': 0, 'tz': -3})
+
+    # 3. Ground plane
+    grid = lop_network.createNode('grid', 'ground')
+    grid.setInput(0, sphere2)
+    grid.setParms({'primpath': '/geo/ground', 'scale': 10, 'ty': -1})
+
+    # 4. Lights
+    dome_light = lop_network.createNode('domelight', 'dome_light')
+    dome_light.setInput(0, grid)
+    dome_light.setParms({'primpath': '/lights/dome', 'intensity': 1.0})
+
+    # 5. Karma render settings
+    render_settings = lop_network.createNode('karmarenderproperties', 'karma_settings')
+    render_settings.setInput(0, dome_light)
+
+    # Configure Karma settings
+    render_settings.setParms(_KARMA_DEFAULTS)
+
+    # 6. Configure Karma LOP
+    karma_node = lop_network.createNode('karma', 'render')
+    karma_node.setInput(0, render_settings)
+
+    # Set render camera and output
+    karma_node.setParms({
+        'camera': '/cameras/lentil_camera',
+        'picture': '$HIP/render/$HIPNAME.$F4.exr',
+    })
+
+    return [camera, sphere1, sphere2, grid, dome_light, render_settings, karma_node]
+
+
+def save_lop_network_snippet(lop_network):
+    """
+    Save the nodes of a lentil LOP network as the reusable snippet
+
+    Args:
+        lop_network: LOP network created by create_lentil_lop_network
+    """
+    lop_network.saveItemsToFile(lop_network.children(), _NETWORK_SNIPPET, save_hidden=False)
+    print(f"✓ Saved LOP network snippet: {_NETWORK_SNIPPET}")
+
+
+@dataclass(frozen=True)
+class ParmSpec:
+    """
+    One parameter of the Lentil Lens folder
+
+    The template type follows the default: bool -> toggle, str -> string,
+    int -> int, float -> float. min/max only apply to numeric parameters;
+    max=None leaves the slider range at Houdini's default.
+    """
+    name: str
+    label: str
+    default: Union[bool, int, float, str]
+    min: Optional[float] = None
+    max: Optional[float] = None
+    help: str = ''
+
+    def make_template(self):
+        """
+        Build the hou.ParmTemplate described by this spec
+
+        Returns:
+            hou.ParmTemplate for the parameter
+        """
+        if isinstance(self.default, bool):
+            return hou.ToggleParmTemplate(self.name, self.label,
+                                          default_value=self.default, help=self.help)
+        if isinstance(self.default, str):
+            return hou.StringParmTemplate(self.name, self.label, 1,
+                                          default_value=[self.default], help=self.help)
+
+        template_type = hou.IntParmTemplate if isinstance(self.default, int) else hou.FloatParmTemplate
+        limits = {'min': self.min}
+        if self.max is not None:
+            limits['max'] = self.max
+        return template_type(self.name, self.label, 1, default_value=[self.default],
+                             help=self.help, **limits)
+
+
+# Lentil Lens folder contents in display order
+_ALL_SPECS = (
+    ParmSpec('enable_lentil', 'Enable Lentil', True,
+             help='Enable lentil polynomial optics for realistic lens aberrations'),
+    ParmSpec('lens_model', 'Lens Model', 'double_gauss_50mm',
+             help='Select lens model from database'),
+    ParmSpec('lentil_focal_length', 'Focal Length (mm)', 50.0, 1.0, 500.0,
+             help='Lens focal length in millimeters'),
+    ParmSpec('lentil_fstop', 'F-Stop', 2.8, 0.0, 64.0,
+             help='Aperture f-stop (lower = more DOF)'),
+    ParmSpec('lentil_focus_distance', 'Focus Distance (mm)', 5000.0, 0.1,
+             help='Focus distance in millimeters'),
+    ParmSpec('lentil_sensor_width', 'Sensor Width (mm)', 36.0, 1.0, 100.0,
+             help='Camera sensor width (36mm = full-frame)'),
+    ParmSpec('chromatic_aberration', 'Chromatic Aberration', 1.0, 0.0, 2.0,
+             help='Chromatic aberration intensity (0=off, 1=normal)'),
+    ParmSpec('bokeh_blades', 'Bokeh Blades', 0, 0, 16,
+             help='Number of aperture blades (0=circular)'),
+    ParmSpec('bokeh_rotation', 'Bokeh Rotation', 0.0, 0.0, 360.0,
+             help='Aperture rotation in degrees'),
+    ParmSpec('enable_bidirectional', 'Enable Bidirectional', True,
+             help='Enable bidirectional filtering for realistic bokeh highlights'),
+    ParmSpec('bokeh_intensity', 'Bokeh Intensity', 1.0, 0.0, 3.0,
+             help='Bokeh highlight intensity multiplier'),
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _get_lentil_folder():
+    """
+    Lentil Lens folder template, built once and shared by all cameras
+
+    Returns:
+        hou.FolderParmTemplate with all lentil parameters
+    """
+    templates = [spec.make_template() for spec in _ALL_SPECS]
+    return hou.FolderParmTemplate('lentil_folder', 'Lentil Lens', parm_templates=templates)
+
+
+def _lentil_folder_present(node_type):
+    """
+    Whether a node type defines the Lentil Lens folder itself
+
+    Decided once per node type and cached in hou.session.
+
+    Args:
+        node_type: hou.NodeType of a camera node
+
+    Returns:
+        True if the type's parameter template group has 'lentil_folder'
+    """
+    # Type names are only unique within a category ('Lop/camera')
+    key = node_type.nameWithCategory()
+    present = getattr(hou.session, '_lentil_present', None)
+    if present is None:
+        present = hou.session._lentil_present = {}
+    if key not in present:
+        present[key] = node_type.parmTemplateGroup().find('lentil_folder') is not None
+    return present[key]
+
+
 def add_lentil_parameters_to_camera(camera_node):
     """
     Add lentil-specific parameters to a LOP camera
@@ -163,136 +344,21 @@ def add_lentil_parameters_to_camera(camera_node):
     Args:
         camera_node: Camera LOP node
     """
-    print("Adding lentil parameters to camera...")
+    # Camera types that ship the folder themselves (the lentil camera HDA)
+    # need nothing per instance
+    if _lentil_folder_present(camera_node.type()):
+        return
 
     parm_template_group = camera_node.parmTemplateGroup()
 
-    # Create lentil folder
-    lentil_folder = hou.FolderParmTemplate('lentil_folder', 'Lentil Lens')
-
-    # Enable toggle
-    lentil_folder.addParmTemplate(
-        hou.ToggleParmTemplate(
-            'enable_lentil',
-            'Enable Lentil',
-            default_value=True
-        )
-    )
-
-    # Lens model
-    lentil_folder.addParmTemplate(
-        hou.StringParmTemplate(
-            'lens_model',
-            'Lens Model',
-            1,
-            default_value=['double_gauss_50mm']
-        )
-    )
-
-    # Focal length (mm)
-    lentil_folder.addParmTemplate(
-        hou.FloatParmTemplate(
-            'lentil_focal_length',
-            'Focal Length (mm)',
-            1,
-            default_value=[50.0],
-            min=1.0,
-            max=500.0
-        )
-    )
-
-    # F-stop
-    lentil_folder.addParmTemplate(
-        hou.FloatParmTemplate(
-            'lentil_fstop',
-            'F-Stop',
-            1,
-            default_value=[2.8],
-            min=0.0,
-            max=64.0
-        )
-    )
-
-    # Focus distance (mm)
-    lentil_folder.addParmTemplate(
-        hou.FloatParmTemplate(
-            'lentil_focus_distance',
-            'Focus Distance (mm)',
-            1,
-            default_value=[5000.0],
-            min=0.1
-        )
-    )
-
-    # Sensor width
-    lentil_folder.addParmTemplate(
-        hou.FloatParmTemplate(
-            'lentil_sensor_width',
-            'Sensor Width (mm)',
-            1,
-            default_value=[36.0],
-            min=1.0,
-            max=100.0
-        )
-    )
-
-    # Chromatic aberration
-    lentil_folder.addParmTemplate(
-        hou.FloatParmTemplate(
-            'chromatic_aberration',
-            'Chromatic Aberration',
-            1,
-            default_value=[1.0],
-            min=0.0,
-            max=2.0
-        )
-    )
-
-    # Bokeh blades
-    lentil_folder.addParmTemplate(
-        hou.IntParmTemplate(
-            'bokeh_blades',
-            'Bokeh Blades',
-            1,
-            default_value=[0],
-            min=0,
-            max=16
-        )
-    )
-
-    # Bokeh rotation
-    lentil_folder.addParmTemplate(
-        hou.FloatParmTemplate(
-            'bokeh_rotation',
-            'Bokeh Rotation',
-            1,
-            default_value=[0.0],
-            min=0.0,
-            max=360.0
-        )
-    )
-
-    # Bidirectional
-    lentil_folder.addParmTemplate(
-        hou.ToggleParmTemplate(
-            'enable_bidirectional',
-            'Enable Bidirectional',
-            default_value=True
-        )
-    )
-
-    lentil_folder.addParmTemplate(
-        hou.FloatParmTemplate(
-            'bokeh_intensity',
-            'Bokeh Intensity',
-            1,
-            default_value=[1.0],
-            min=0.0,
-            max=3.0
-        )
-    )
-
-    parm_template_group.append(lentil_folder)
+    # Already installed - skip the parameter-dialog rebuild entirely
+    if parm_template_group.find('lentil_folder'):
+        print(f"Lentil parameters already present on {camera_node.path()}")
+        return
+
+    print("Adding lentil parameters to camera...")
+
+    parm_template_group.append(_get_lentil_folder())
     camera_node.setParmTemplateGroup(parm_template_group)
 
     print(f"✓ Added lentil parameters to {camera_node.path()}")
@@ -8,15 +8,65 @@ NOTE: Lentil parameters are added to cameras via OnCreated callback,
 not by modifying the node type. See scripts/lop/camera_OnCreated.py
 """
 
+import functools
 import hou
 import sys
 import os
 
 
+# Startup banner, written in one call
+_BANNER = """
+{line}
+KarmaLentil - Polynomial Optics for Houdini Karma
+{line}
+✓ OnCreated callback installed for camera nodes
+✓ Lentil parameters will be added automatically
+Shelf: karmalentil
+Documentation: $KARMALENTIL/
+
+Quick Start:
+  1. Create a camera LOP node
+  2. Look for the 'Lentil Lens' tab (auto-added!)
+  3. Enable 'Enable Lentil' toggle
+  4. Adjust parameters and render!
+
+  OR use shelf: Click 'Lentil Camera' for complete setup
+{line}
+
+""".format(line='=' * 60)
+
+
+# sys.path entries as a set for O(1) membership tests (Houdini's sys.path is long)
+_SYS_PATH_SET = set(sys.path)
+
+
+@functools.lru_cache(maxsize=64)
+def _stat_exists(path):
+    """
+    os.path.exists, cached - stat() can cost milliseconds on network drives
+    """
+    return os.path.exists(path)
+
+
+@functools.lru_cache(maxsize=1)
+def get_lens_database():
+    """
+    Lens database shared with the callbacks (lens_database singleton)
+
+    Imported and loaded on first use rather than at Houdini startup.
+    """
+    from lens_database import get_lens_database as _get_lens_database
+    return _get_lens_database()
+
+
 def initialize_karmalentil():
     """
     Initialize KarmaLentil plugin on Houdini startup
     """
+    # Only initialize once per session
+    if getattr(hou.session, '_karmalentil_initialized', False):
+        return
+
     # Get KarmaLentil path from environment
     karmalentil_path = hou.getenv("KARMALENTIL")
 
@@ -26,41 +76,18 @@ def initialize_karmalentil():
 
     # Add Python path
     python_path = os.path.join(karmalentil_path, "python")
-    if os.path.exists(python_path) and python_path not in sys.path:
+    if _stat_exists(python_path) and python_path not in _SYS_PATH_SET:
         sys.path.insert(0, python_path)
+        _SYS_PATH_SET.add(python_path)
+
+    # Lens database is loaded lazily (first camera / menu access)
+    hou.session.get_lens_database = get_lens_database
+
+    # Print welcome message (interactive sessions only - keeps farm logs clean)
+    if hou.isUIAvailable():
+        sys.stdout.write(_BANNER)
 
-    # Initialize lens database
-    try:
-        from lens_database import LensDatabase
-        db = LensDatabase()
-
-        # Store in hou.session for later access
-        hou.session.lentil_lens_database = db
-
-        print(f"KarmaLentil: Initialized with {len(db.lenses)} lens models")
-
-    except Exception as e:
-        print(f"KarmaLentil: Warning - Could not initialize lens database: {e}")
-
-    # Print welcome message
-    print("")
-    print("=" * 60)
-    print("KarmaLentil - Polynomial Optics for Houdini Karma")
-    print("=" * 60)
-    print("✓ OnCreated callback installed for camera nodes")
-    print("✓ Lentil parameters will be added automatically")
-    print("Shelf: karmalentil")
-    print("Documentation: $KARMALENTIL/")
-    print("")
-    print("Quick Start:")
-    print("  1. Create a camera LOP node")
-    print("  2. Look for the 'Lentil Lens' tab (auto-added!)")
-    print("  3. Enable 'Enable Lentil' toggle")
-    print("  4. Adjust parameters and render!")
-    print("")
-    print("  OR use shelf: Click 'Lentil Camera' for complete setup")
-    print("=" * 60)
-    print("")
+    hou.session._karmalentil_initialized = True
 
 
 # Run initialization
@@ -20,6 +20,8 @@
 #include <vector>
 #include <string>
 #include <cmath>
+#include <stdexcept>
+#include <tuple>
 
 namespace py = pybind11;
 
@@ -168,7 +170,72 @@ public:
         return std::make_tuple(true, exit_pos, exit_dir);
     }
 
-    // TODO: Implement batch raytracing once single ray works
+    /**
+     * Trace a batch of rays through the lens system
+     *
+     * Same model as trace_ray, run over [N, 3] numpy arrays in one call so
+     * there is no per-ray Python round trip or vector allocation.
+     *
+     * Returns: (success_flags [N], exit_positions [N, 3], exit_directions [N, 3])
+     */
+    std::tuple<py::array_t<bool>, py::array_t<double>, py::array_t<double>> trace_rays_batch(
+        py::array_t<double, py::array::c_style | py::array::forcecast> sensor_positions,
+        py::array_t<double, py::array::c_style | py::array::forcecast> sensor_directions,
+        double wavelength = 550.0) {
+
+        if (sensor_positions.ndim() != 2 || sensor_positions.shape(1) != 3 ||
+            sensor_directions.ndim() != 2 || sensor_directions.shape(1) != 3 ||
+            sensor_positions.shape(0) != sensor_directions.shape(0)) {
+            throw std::invalid_argument("sensor_positions and sensor_directions must both be [N, 3]");
+        }
+
+        const py::ssize_t num_rays = sensor_positions.shape(0);
+        py::array_t<bool> success_flags(num_rays);
+        py::array_t<double> exit_positions({num_rays, py::ssize_t(3)});
+        py::array_t<double> exit_directions({num_rays, py::ssize_t(3)});
+
+        const double* pos = sensor_positions.data();
+        const double* dir = sensor_directions.data();
+        bool* success = success_flags.mutable_data();
+        double* out_pos = exit_positions.mutable_data();
+        double* out_dir = exit_directions.mutable_data();
+        const double exit_z = lens_system->total_lens_length;
+
+        {
+            // The loop touches only raw buffers - let other Python threads
+            // run (the GIL is re-acquired before the arrays are returned)
+            py::gil_scoped_release release;
+
+            // Straight loop over contiguous buffers, left to the compiler to
+            // vectorize; rays are independent, so split them across threads
+            // when built with OpenMP
+#ifdef _OPENMP
+            #pragma omp parallel for schedule(static)
+#endif
+            for (py::ssize_t i = 0; i < num_rays; i++) {
+                const double* p = pos + 3 * i;
+                const double* d = dir + 3 * i;
+
+                // Normalize direction (zero-length directions are left as is,
+                // like Eigen's normalize())
+                const double len = std::sqrt(d[0] * d[0] + d[1] * d[1] + d[2] * d[2]);
+                const double inv_len = len > 0.0 ? 1.0 / len : 1.0;
+
+                out_pos[3 * i + 0] = p[0];
+                out_pos[3 * i + 1] = p[1];
+                out_pos[3 * i + 2] = exit_z;
+
+                out_dir[3 * i + 0] = d[0] * inv_len;
+                out_dir[3 * i + 1] = d[1] * inv_len;
+                out_dir[3 * i + 2] = d[2] * inv_len;
+
+                // Mark as successful (for now, no vignetting check)
+                success[i] = true;
+            }
+        }
+
+        return std::make_tuple(success_flags, exit_positions, exit_directions);
+    }
 };
 
 /**
@@ -201,6 +268,11 @@ PYBIND11_MODULE(polynomial_optics_binding, m) {
              "Trace a single ray through lens system (sensor to scene)",
              py::arg("sensor_pos"),
              py::arg("sensor_dir"),
+             py::arg("wavelength") = 550.0)
+        .def("trace_rays_batch", &CppRaytracer::trace_rays_batch,
+             "Trace a batch of rays through lens system (sensor to scene)",
+             py::arg("sensor_positions"),
+             py::arg("sensor_directions"),
              py::arg("wavelength") = 550.0);
 
     // Version information
@@ -86,10 +86,10 @@ except Exception as e:
 # Test 5: Trace multiple rays
 print("\n5. Tracing batch of rays...")
 num_rays = 100
-np.random.seed(42)
-sensor_positions = np.random.randn(num_rays, 3) * 5  # Random positions within 5mm
+rng = np.random.default_rng(42)
+sensor_positions = rng.standard_normal((num_rays, 3)) * 5  # Random positions within 5mm
 sensor_positions[:, 2] = 0  # All on sensor plane
-sensor_directions = np.tile([0, 0, 1], (num_rays, 1))  # All pointing forward
+sensor_directions = np.broadcast_to([0.0, 0.0, 1.0], (num_rays, 3))  # All pointing forward (zero-copy view)
 
 try:
     success_flags, exit_positions, exit_directions = raytracer.trace_rays_batch(
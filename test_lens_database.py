@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+Lens Database Test
+
+Exercises the lens database caches in a temporary directory:
+1. load_lens falls back to the JSON record when the .npz sidecar is
+   empty, truncated, garbage or written from another version of the JSON
+   (even one with an older mtime), and rewrites the sidecar
+2. search_lenses (trigram index over the catalog) returns the same lenses
+   as a linear scan of the JSON records
+"""
+
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+# Add python directory to path
+sys.path.insert(0, str(Path(__file__).parent / 'python'))
+
+from potk import LensDatabaseManager
+
+MAKERS = ('Zeiss', 'Leica', 'Cooke', 'Angénieux')
+QUERIES = ('zeiss', 'lei', 'summi', 'ii', 'x', '35', 'planar 30', 'angé', 'nomatch', 'S')
+
+
+def make_database(root):
+    """Save a few lenses into a fresh database"""
+    db_manager = LensDatabaseManager(root)
+    names = ('Summicron', 'Planar', 'Speed Panchro', 'Optimo', 'Summilux II', 'Distagon')
+    for i, name in enumerate(names):
+        focal = 25 + 5 * i
+        lens_data = {
+            'name': f"{name} {focal}mm",
+            'maker': MAKERS[i % len(MAKERS)],
+            'focal_length': float(focal),
+        }
+        coefficients = {
+            'exit_pupil_x': [0.5 * i, 1.25, -3.0e-4],
+            'exit_pupil_y': [0.0, -2.5, 1.0e-6 * i],
+        }
+        db_manager.save_lens(f"lens_{i:02d}", lens_data, coefficients)
+    return db_manager
+
+
+def linear_search(db_manager, query):
+    """Lens ids whose name or metadata contains the query, from the JSON files"""
+    query_lower = query.lower()
+    matches = set()
+    for lens_file in db_manager.fitted_dir.glob('*.json'):
+        with open(lens_file, 'r') as f:
+            record = json.load(f)
+        if (query_lower in record['name'].lower() or
+                query_lower in json.dumps(record['metadata']).lower()):
+            matches.add(record['id'])
+    return matches
+
+
+def check_sidecar_fallback(db_manager):
+    """Corrupt the .npz sidecar of one lens in several ways and reload it"""
+    lens_id = 'lens_01'
+    sidecar = db_manager.fitted_dir / f"{lens_id}.npz"
+    with open(db_manager.fitted_dir / f"{lens_id}.json", 'r') as f:
+        expected = json.load(f)
+
+    intact = sidecar.read_bytes()
+    corruptions = {
+        'empty': b'',
+        'truncated': intact[:len(intact) // 2],
+        'garbage': b'not a zip archive' * 8,
+    }
+
+    ok = True
+    for name, data in corruptions.items():
+        sidecar.write_bytes(data)
+        try:
+            lens = db_manager.load_lens(lens_id)
+        except Exception as e:
+            print(f"✗ {name} sidecar: load_lens raised {type(e).__name__}: {e}")
+            ok = False
+            continue
+
+        if lens != expected:
+            print(f"✗ {name} sidecar: loaded record differs from the JSON")
+            ok = False
+        elif sidecar.read_bytes() == data:
+            print(f"✗ {name} sidecar: not rewritten")
+            ok = False
+        elif db_manager.load_lens(lens_id) != expected:
+            print(f"✗ {name} sidecar: rewritten sidecar loads a different record")
+            ok = False
+        else:
+            print(f"✓ {name} sidecar: fell back to JSON and rewrote the cache")
+
+    return ok
+
+
+def check_replaced_json(db_manager):
+    """Replace a lens JSON with an edited copy that keeps an older mtime (cp -p)"""
+    lens_id = 'lens_03'
+    lens_path = db_manager.fitted_dir / f"{lens_id}.json"
+    db_manager.load_lens(lens_id)
+    old_stat = lens_path.stat()
+
+    with open(lens_path, 'r') as f:
+        record = json.load(f)
+    record['coefficients']['exit_pupil_x'][0] = 42.0
+    with open(lens_path, 'w') as f:
+        json.dump(record, f, indent=2)
+    os.utime(lens_path, ns=(old_stat.st_atime_ns, old_stat.st_mtime_ns - 10**9))
+
+    lens = db_manager.load_lens(lens_id)
+    if lens['coefficients']['exit_pupil_x'][0] != 42.0:
+        print("✗ replaced JSON with older mtime: stale sidecar coefficients returned")
+        return False
+
+    print("✓ replaced JSON with older mtime: sidecar ignored")
+    return True
+
+
+def check_search(db_manager):
+    """Compare search_lenses against a linear scan"""
+    ok = True
+    for query in QUERIES:
+        found = [lens['id'] for lens in db_manager.search_lenses(query)]
+        expected = linear_search(db_manager, query)
+        if len(found) != len(set(found)) or set(found) != expected:
+            print(f"✗ search '{query}': {sorted(found)} != {sorted(expected)}")
+            ok = False
+        else:
+            print(f"✓ search '{query}': {len(found)} match(es)")
+    return ok
+
+
+def main():
+    print("=" * 60)
+    print("Lens Database Test")
+    print("=" * 60)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        db_manager = make_database(Path(tmp))
+
+        print("\n1. .npz sidecar fallback")
+        print("-" * 60)
+        sidecar_ok = check_sidecar_fallback(db_manager)
+        sidecar_ok = check_replaced_json(db_manager) and sidecar_ok
+
+        print("\n2. search_lenses vs. linear scan")
+        print("-" * 60)
+        search_ok = check_search(db_manager)
+
+        # Search again once the catalog is cached, after changing one lens
+        print("\n   ...after renaming a lens")
+        lens = db_manager.load_lens('lens_02')
+        lens['metadata']['name'] = 'Renamed Zeiss Lens'
+        db_manager.save_lens('lens_02', lens['metadata'], lens['coefficients'])
+        search_ok = check_search(db_manager) and search_ok
+
+    print()
+    if not (sidecar_ok and search_ok):
+        print("✗ Lens database checks failed")
+        return 1
+
+    print("✓ All lens database checks passed")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+"""
+Ray Trace Backend Test
+
+Checks every trace_rays_batch backend available here against the scalar
+reference SimpleRaytracer.trace_ray_scalar:
+1. NumPy vectorized path
+2. Numba kernel specialized per prescription (if Numba is installed)
+3. Ahead-of-time compiled kernel (if built with build_aot.py)
+4. CUDA kernel (if a GPU or NUMBA_ENABLE_CUDASIM=1 is available)
+
+Each backend traces the same rays through a few lens prescriptions at two
+wavelengths; failed rays must agree and exit rays must match to 1e-9.
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add python directory to path
+sys.path.insert(0, str(Path(__file__).parent / 'python'))
+
+from potk.simple_raytracer import SimpleRaytracer
+from potk import simple_raytracer, _raytrace_codegen, _raytrace_numba
+
+TOLERANCE = 1e-9
+WAVELENGTHS = (550.0, 450.0)
+
+# Small prescriptions that let most rays through, mixing flat and curved
+# surfaces (the example lens only passes rays close to the axis)
+TEST_LENSES = {
+    'singlet': {'elements': [
+        {'radius': 80.0, 'thickness': 5.0, 'material': 'N-BK7', 'diameter': 50.0},
+    ]},
+    'cemented': {'elements': [
+        {'radius': 0.0, 'thickness': 2.0, 'material': 'air', 'diameter': 60.0},
+        {'radius': 80.0, 'thickness': 5.0, 'material': 'N-BK7', 'diameter': 50.0},
+        {'radius': 0.0, 'thickness': 3.0, 'material': 'N-SK16', 'diameter': 45.0},
+        {'radius': -60.0, 'thickness': 8.0, 'material': 'air', 'diameter': 40.0},
+    ]},
+}
+
+
+def make_rays(num_rays=3000, seed=1):
+    """Random rays from just behind the sensor, including some that fail"""
+    rng = np.random.default_rng(seed)
+    origins = np.zeros((num_rays, 3))
+    origins[:, :2] = rng.uniform(-25, 25, (num_rays, 2))
+    origins[:, 2] = rng.uniform(-5, 0, num_rays)
+    directions = np.stack([rng.uniform(-0.6, 0.6, num_rays),
+                           rng.uniform(-0.6, 0.6, num_rays),
+                           np.ones(num_rays)], axis=1)
+    # Rays parallel to the surfaces never reach them
+    directions[:50, 2] = 0.0
+    return origins, directions
+
+
+def trace_reference(raytracer, origins, directions, wavelength):
+    """Trace rays one by one with trace_ray_scalar"""
+    exit_pos = np.full(origins.shape, np.nan)
+    exit_dir = np.full(origins.shape, np.nan)
+    for i, (o, d) in enumerate(zip(origins, directions)):
+        result = raytracer.trace_ray_scalar(*o, *d, wavelength=wavelength)
+        if result is not None:
+            exit_pos[i] = result[:3]
+            exit_dir[i] = result[3:]
+    return exit_pos, exit_dir
+
+
+def compare(name, result, reference):
+    """Compare (positions, directions) against the reference, print and return success"""
+    for got, want, what in zip(result, reference, ('positions', 'directions')):
+        got = np.asarray(got, dtype=np.float64)
+        failed_got, failed_want = np.isnan(got[:, 0]), np.isnan(want[:, 0])
+        if (failed_got != failed_want).any():
+            print(f"✗ {name}: {np.count_nonzero(failed_got != failed_want)} rays "
+                  f"fail differently ({what})")
+            return False
+        ok = ~failed_want
+        diff = np.abs(got[ok] - want[ok]).max() if ok.any() else 0.0
+        if diff > TOLERANCE:
+            print(f"✗ {name}: {what} differ by {diff:.3g}")
+            return False
+    print(f"✓ {name}")
+    return True
+
+
+def get_backends(raytracer):
+    """Backends available in this environment, as name -> f(origins, dirs, wavelength)"""
+    radii = tuple(raytracer.radius.tolist())
+    thicks = tuple(raytracer.thickness.tolist())
+    diams = tuple(raytracer.diameter.tolist())
+
+    def numpy_backend(origins, dirs, wavelength):
+        exit_pos = np.zeros(origins.shape)
+        exit_dir = np.zeros(origins.shape)
+        raytracer._trace_chunk_vectorized(origins, dirs, wavelength, exit_pos, exit_dir)
+        return exit_pos, exit_dir
+
+    backends = {
+        'NumPy vectorized': numpy_backend,
+        'trace_rays_batch': raytracer.trace_rays_batch,
+    }
+
+    if _raytrace_numba.HAS_NUMBA:
+        def numba_backend(origins, dirs, wavelength):
+            kernel = _raytrace_codegen.get_specialized_kernel(radii, thicks, diams)
+            exit_pos = np.zeros(origins.shape)
+            exit_dir = np.zeros(origins.shape)
+            kernel(origins, dirs, raytracer._indices(wavelength).astype(np.float64),
+                   exit_pos, exit_dir)
+            return exit_pos, exit_dir
+
+        backends['Numba specialized kernel'] = numba_backend
+
+    if simple_raytracer._aot_trace_batch is not None:
+        def aot_backend(origins, dirs, wavelength):
+            exit_pos = np.zeros(origins.shape)
+            exit_dir = np.zeros(origins.shape)
+            simple_raytracer._aot_trace_batch(
+                origins, dirs, raytracer.radius, raytracer.thickness, raytracer.diameter,
+                raytracer._indices(wavelength).astype(np.float64), exit_pos, exit_dir)
+            return exit_pos, exit_dir
+
+        backends['AOT kernel'] = aot_backend
+
+    try:
+        from potk import _raytrace_cuda
+        has_cuda = _raytrace_cuda.HAS_CUDA
+    except ImportError:
+        has_cuda = False
+
+    if has_cuda:
+        def cuda_backend(origins, dirs, wavelength):
+            kernel = _raytrace_cuda.get_cuda_kernel(radii, thicks, diams)
+            return _raytrace_cuda.trace_batch_cuda(kernel, origins, dirs,
+                                                   raytracer._indices(wavelength), np.float64)
+
+        backends['CUDA kernel'] = cuda_backend
+
+    return backends
+
+
+def main():
+    print("=" * 60)
+    print("Ray Trace Backend Test")
+    print("=" * 60)
+
+    lens_path = Path(__file__).parent / 'database' / 'optical_designs' / 'example_lens.json'
+    with open(lens_path, 'r') as f:
+        lenses = dict(TEST_LENSES, example_lens=json.load(f))
+
+    origins, directions = make_rays()
+    failures = 0
+
+    for lens_name, lens_data in lenses.items():
+        raytracer = SimpleRaytracer.from_lens_data(lens_data, dtype=np.float64)
+        backends = get_backends(raytracer)
+
+        for wavelength in WAVELENGTHS:
+            print(f"\n{lens_name}, {wavelength:g}nm")
+            print("-" * 60)
+
+            reference = trace_reference(raytracer, origins, directions, wavelength)
+            valid = np.count_nonzero(~np.isnan(reference[0][:, 0]))
+            print(f"  Reference: {valid}/{len(origins)} rays pass")
+
+            for name, backend in backends.items():
+                try:
+                    result = backend(origins, directions, wavelength)
+                except Exception as e:
+                    print(f"✗ {name}: {e}")
+                    failures += 1
+                    continue
+                if not compare(name, result, reference):
+                    failures += 1
+
+    print(f"\nBackends: {', '.join(backends)}")
+    if 'CUDA kernel' not in backends and not os.environ.get('NUMBA_ENABLE_CUDASIM'):
+        print("  (set NUMBA_ENABLE_CUDASIM=1 to check the CUDA kernel without a GPU)")
+
+    print()
+    if failures:
+        print(f"✗ {failures} backend check(s) failed")
+        return 1
+
+    print("✓ All backends match trace_ray_scalar")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -14,11 +14,31 @@ Example:
 
 import argparse
 import sys
+import traceback
 import json
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
+import numpy as np
+
+# orjson reads and writes float-heavy lens files several times faster
+try:
+    import orjson
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Use the installed package (pip install -e .) if there is one, otherwise
+# the checkout's python/ directory
+try:
+    import potk  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
 
 from potk import LensImporter, PolyFitter, LensDatabaseManager
 
@@ -110,8 +130,7 @@ def main():
         if not args.lens_design.exists():
             raise FileNotFoundError(f"Lens design file not found: {args.lens_design}")
 
-        with open(args.lens_design, 'r') as f:
-            lens_data = json.load(f)
+        lens_data = _json_loads(args.lens_design.read_bytes())
 
         print(f"\n✓ Lens design loaded")
         print(f"  Name: {lens_data.get('name', 'Unknown')}")
@@ -188,10 +207,19 @@ def main():
                 filename = f"{args.lens_design.stem}_fitted.json"
                 output_file = output_file / filename
 
+            output_file.parent.mkdir(parents=True, exist_ok=True)
+
+            # Coefficients go to a binary sidecar next to the JSON
+            coefficients_file = output_file.with_suffix('.npz')
+            np.savez(coefficients_file, **{
+                key: np.asarray(values, dtype=np.float64)
+                for key, values in coefficients.items()
+            })
+
             # Create complete fitted lens data
             fitted_data = {
                 'metadata': lens_data,
-                'coefficients': coefficients,
+                'coefficients_npz': coefficients_file.name,
                 'polynomial_degree': degree,
                 'fit_samples': args.samples
             }
@@ -199,9 +227,7 @@ def main():
             if validation_report:
                 fitted_data['validation'] = validation_report
 
-            output_file.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_file, 'w') as f:
-                json.dump(fitted_data, f, indent=2)
+            output_file.write_bytes(_json_dumps(fitted_data))
 
             print(f"\n✓ Fitted data saved to: {output_file}")
 
@@ -215,7 +241,6 @@ def main():
     except Exception as e:
         print(f"\n✗ Error fitting lens: {e}", file=sys.stderr)
         if args.verbose:
-            import traceback
             traceback.print_exc()
         return 1
 
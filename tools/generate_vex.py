@@ -14,11 +14,25 @@ Example:
 
 import argparse
 import sys
+import traceback
 import json
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
+import numpy as np
+
+# orjson parses float-heavy lens files several times faster; both accept bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+# Use the installed package (pip install -e .) if there is one, otherwise
+# the checkout's python/ directory
+try:
+    import potk  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
 
 from potk import VEXGenerator, LensDatabaseManager
 
@@ -67,6 +81,13 @@ def main():
         help='Overwrite existing shaders in batch mode'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for batch mode (default: 1)'
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -93,24 +114,25 @@ def main():
 
             print(f"Found {len(all_lenses)} lenses in database\n")
 
-            # Load all lens data
-            lens_database = {}
-            for lens_info in all_lenses:
-                lens_id = lens_info['id']
-                lens_record = db_manager.load_lens(lens_id)
-                if lens_record:
-                    # Flatten structure for VEX generator
-                    lens_database[lens_id] = {
-                        **lens_record['metadata'],
-                        'coefficients': lens_record['coefficients']
-                    }
+            # Load all lens data in one go
+            lens_records = db_manager.load_many([lens_info['id'] for lens_info in all_lenses])
+
+            # Flatten structure for VEX generator
+            lens_database = {
+                lens_id: {
+                    **lens_record['metadata'],
+                    'coefficients': lens_record['coefficients']
+                }
+                for lens_id, lens_record in lens_records.items()
+            }
 
             # Generate batch
             generator = VEXGenerator()
             generator.generate_batch(
                 lens_database=lens_database,
                 output_dir=args.output_dir,
-                overwrite=args.overwrite
+                overwrite=args.overwrite,
+                jobs=args.jobs
             )
 
             return 0
@@ -139,12 +161,16 @@ def main():
             # Load from file
             print(f"Loading fitted lens: {fitted_lens_path}")
 
-            with open(fitted_lens_path, 'r') as f:
-                fitted_data = json.load(f)
+            fitted_data = _json_loads(fitted_lens_path.read_bytes())
 
-            # Extract lens data and coefficients
+            # Extract lens data and coefficients (fit_lens.py stores the
+            # coefficients in an .npz sidecar next to the JSON)
             lens_data = fitted_data.get('metadata', fitted_data)
-            coefficients = fitted_data.get('coefficients', {})
+            coefficients = fitted_data.get('coefficients')
+            if coefficients is None and 'coefficients_npz' in fitted_data:
+                with np.load(fitted_lens_path.parent / fitted_data['coefficients_npz']) as npz:
+                    coefficients = {key: npz[key].tolist() for key in npz.files}
+            coefficients = coefficients or {}
 
             print(f"✓ Loaded from file")
 
@@ -177,7 +203,6 @@ def main():
     except Exception as e:
         print(f"\n✗ Error generating VEX shader: {e}", file=sys.stderr)
         if args.verbose:
-            import traceback
             traceback.print_exc()
         return 1
 
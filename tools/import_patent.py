@@ -13,10 +13,15 @@ Example:
 
 import argparse
 import sys
+import traceback
 from pathlib import Path
 
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
+# Use the installed package (pip install -e .) if there is one, otherwise
+# the checkout's python/ directory
+try:
+    import potk  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
 
 from potk import LensImporter
 
@@ -107,7 +112,6 @@ def main():
     except Exception as e:
         print(f"\n✗ Error importing patent: {e}", file=sys.stderr)
         if args.verbose:
-            import traceback
             traceback.print_exc()
         return 1
 
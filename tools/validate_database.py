@@ -14,14 +14,77 @@ Example:
 
 import argparse
 import sys
+import traceback
 import json
 from pathlib import Path
 from datetime import datetime
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
-
-from potk import LensDatabaseManager
+from typing import Tuple
+
+# orjson encodes large error lists several times faster
+try:
+    import orjson
+
+    def _json_dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    def _json_dumps(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode('utf-8')
+
+# Use the installed package (pip install -e .) if there is one, otherwise
+# the checkout's python/ directory
+try:
+    import potk  # noqa: F401
+except ImportError:
+    sys.path.insert(0, str(Path(__file__).parent.parent / 'python'))
+
+
+def _validate_streaming(db_manager: 'LensDatabaseManager', report, jobs: int = 1) -> Tuple[int, int]:
+    """
+    Validate the database, optionally writing the JSON report incrementally
+
+    Args:
+        db_manager: Database to validate
+        report: Binary file for the JSON report, or None
+        jobs: Number of worker processes
+
+    Returns:
+        Tuple of (valid_count, invalid_count)
+    """
+    print("\nValidating lens database...")
+
+    if report:
+        report.write(
+            b'{\n  "timestamp": ' + _json_dumps(datetime.now().isoformat())
+            + b',\n  "database_root": ' + _json_dumps(str(db_manager.database_root))
+            + b',\n  "errors": ['
+        )
+
+    valid_count = 0
+    invalid_count = 0
+
+    for name, error in db_manager.iter_validate(jobs=jobs):
+        if error is None:
+            valid_count += 1
+            print(f"  ✓ {name}")
+            continue
+
+        error_msg = f"  ✗ {name}: {error}"
+        print(error_msg)
+        if report:
+            report.write((b',\n    ' if invalid_count else b'\n    ') + _json_dumps(error_msg))
+        invalid_count += 1
+
+    print(f"\nValidation complete: {valid_count} valid, {invalid_count} invalid")
+
+    if report:
+        report.write(
+            (b'\n  ],' if invalid_count else b'],')
+            + b'\n  "total_lenses": %d' % (valid_count + invalid_count)
+            + b',\n  "valid_lenses": %d' % valid_count
+            + b',\n  "invalid_lenses": %d\n}' % invalid_count
+        )
+
+    return valid_count, invalid_count
 
 
 def main():
@@ -56,6 +119,13 @@ def main():
         help='Search for lenses by name or metadata'
     )
 
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Worker processes for validation (default: 1)'
+    )
+
     parser.add_argument(
         '--verbose',
         action='store_true',
@@ -64,6 +134,9 @@ def main():
 
     args = parser.parse_args()
 
+    # Imported after argument parsing so --help and usage errors stay fast
+    from potk import LensDatabaseManager
+
     print(f"Lens Database Validation")
     print(f"{'='*60}")
 
@@ -81,22 +154,24 @@ def main():
 
             print(f"\nFound {len(lenses)} lenses:\n")
 
+            # Build the listing and write it once instead of printing per line
+            parts = []
+            append = parts.append
             for lens in lenses:
-                print(f"  • {lens['id']}")
-                print(f"    Name: {lens['name']}")
-                print(f"    Created: {lens['created']}")
+                append(f"  • {lens['id']}\n    Name: {lens['name']}\n    Created: {lens['created']}\n")
 
                 if args.verbose:
                     metadata = lens.get('metadata', {})
                     if 'focal_length' in metadata:
-                        print(f"    Focal length: {metadata['focal_length']}mm")
+                        append(f"    Focal length: {metadata['focal_length']}mm\n")
                     if 'max_fstop' in metadata:
-                        print(f"    Max f-stop: f/{metadata['max_fstop']}")
+                        append(f"    Max f-stop: f/{metadata['max_fstop']}\n")
                     if 'polynomial_degree' in metadata:
-                        print(f"    Polynomial degree: {metadata['polynomial_degree']}")
+                        append(f"    Polynomial degree: {metadata['polynomial_degree']}\n")
 
-                print()
+                append("\n")
 
+            sys.stdout.write(''.join(parts))
             return 0
 
         # Search mode
@@ -111,34 +186,23 @@ def main():
 
             print(f"\nFound {len(matches)} matching lenses:\n")
 
-            for lens in matches:
-                print(f"  • {lens['id']}")
-                print(f"    Name: {lens['name']}")
-                print()
-
+            sys.stdout.write(''.join(
+                f"  • {lens['id']}\n    Name: {lens['name']}\n\n" for lens in matches
+            ))
             return 0
 
         # Validation mode (default)
         print(f"\nValidating database...")
         print(f"Database root: {db_manager.database_root}\n")
 
-        valid_count, invalid_count, errors = db_manager.validate_database()
-
-        # Create validation report
-        validation_report = {
-            'timestamp': datetime.now().isoformat(),
-            'database_root': str(db_manager.database_root),
-            'total_lenses': valid_count + invalid_count,
-            'valid_lenses': valid_count,
-            'invalid_lenses': invalid_count,
-            'errors': errors
-        }
-
-        # Export report if requested
+        # Stream results: with --export, errors are written to the report as
+        # they are found instead of being collected first
         if args.export:
-            with open(args.export, 'w') as f:
-                json.dump(validation_report, f, indent=2)
+            with open(args.export, 'wb') as report:
+                valid_count, invalid_count = _validate_streaming(db_manager, report, args.jobs)
             print(f"\n✓ Validation report exported to: {args.export}")
+        else:
+            valid_count, invalid_count = _validate_streaming(db_manager, None, args.jobs)
 
         # Return error code if any validation failures
         if invalid_count > 0:
@@ -151,7 +215,6 @@ def main():
     except Exception as e:
         print(f"\n✗ Error: {e}", file=sys.stderr)
         if args.verbose:
-            import traceback
             traceback.print_exc()
         return 1
 